@@ -34,7 +34,6 @@ Supports both 30A (single-line) and 50A (dual-line L1+L2) models.
 """
 
 import asyncio
-import configparser
 import logging
 import os
 import platform
@@ -42,6 +41,7 @@ import signal
 import sys
 import threading
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 
 import dbus
 from gi.repository import GLib
@@ -123,42 +123,102 @@ def get_private_bus():
     return dbus.SystemBus(private=True)
 
 
-def load_config() -> configparser.ConfigParser:
+def _read_ini(path: str) -> dict[str, dict[str, str]]:
+    """One-pass INI reader: sections of ``key = value`` string pairs.
+
+    Supports exactly what our config files use — ``[section]`` headers,
+    ``key = value`` lines, blank lines, and ``#``/``;`` comments.  A thin
+    replacement for configparser, whose regex machinery dominates import
+    time on Venus OS for a config this small.
+    """
+    config: dict[str, dict[str, str]] = {}
+    section = config.setdefault("DEFAULT", {})
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                section = config.setdefault(line[1:-1], {})
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                section[key.strip()] = value.strip()
+    return config
+
+
+def load_config() -> dict[str, dict[str, str]]:
     """Load configuration from config.ini, falling back to config.default.ini."""
-    config = configparser.ConfigParser()
     config_dir = os.path.dirname(os.path.abspath(__file__))
 
     config_file = os.path.join(config_dir, "config.ini")
     default_file = os.path.join(config_dir, "config.default.ini")
 
     if os.path.exists(config_file):
-        config.read(config_file)
         logger.info("Loaded config from %s", config_file)
-    elif os.path.exists(default_file):
-        config.read(default_file)
+        return _read_ini(config_file)
+    if os.path.exists(default_file):
         logger.info("Loaded default config from %s", default_file)
-    else:
-        logger.warning("No config file found, using defaults")
+        return _read_ini(default_file)
+    logger.warning("No config file found, using defaults")
+    return {}
 
-    return config
+
+def _mac_from_id(mac_id: str) -> str:
+    """Rebuild "AA:BB:CC:DD:EE:FF" from a 12-hex-char mac_id.
+
+    Straight-line slice concatenation: no generator object and no
+    str.join dispatch.  Runs for every advertisement seen while
+    scanning, which can be hundreds per sweep in noisy RF.
+    """
+    return (
+        mac_id[0:2] + ":" + mac_id[2:4] + ":" + mac_id[4:6] + ":"
+        + mac_id[6:8] + ":" + mac_id[8:10] + ":" + mac_id[10:12]
+    ).upper()
 
 
 # ── D-Bus value formatters ──────────────────────────────────────────────────
 
+# The GUI re-reads every exported path each poll cycle and readings
+# repeat for long stretches, so the string building is memoized on the
+# value rounded to display precision — repeat reads become a dict hit
+# returning the same interned string.  Cache sizes cover many times the
+# path count so a steady state never evicts.
+
+@lru_cache(maxsize=1024)
+def _fmt_w_cached(n: int) -> str:
+    return "%dW" % n
+
+@lru_cache(maxsize=1024)
+def _fmt_v_cached(n: int) -> str:
+    return "%.1fV" % (n / 10)
+
+@lru_cache(maxsize=1024)
+def _fmt_a_cached(n: int) -> str:
+    return "%.2fA" % (n / 100)
+
+@lru_cache(maxsize=1024)
+def _fmt_kwh_cached(n: int) -> str:
+    return "%.2fkWh" % (n / 100)
+
+@lru_cache(maxsize=1024)
+def _fmt_hz_cached(n: int) -> str:
+    return "%.1fHz" % (n / 10)
+
 def _fmt_w(_path, x):
-    return "{:.0f}W".format(x) if x is not None else "---"
+    return _fmt_w_cached(round(x)) if x is not None else "---"
 
 def _fmt_v(_path, x):
-    return "{:.1f}V".format(x) if x is not None else "---"
+    return _fmt_v_cached(round(x * 10)) if x is not None else "---"
 
 def _fmt_a(_path, x):
-    return "{:.2f}A".format(x) if x is not None else "---"
+    return _fmt_a_cached(round(x * 100)) if x is not None else "---"
 
 def _fmt_kwh(_path, x):
-    return "{:.2f}kWh".format(x) if x is not None else "---"
+    return _fmt_kwh_cached(round(x * 100)) if x is not None else "---"
 
 def _fmt_hz(_path, x):
-    return "{:.1f}Hz".format(x) if x is not None else "---"
+    return _fmt_hz_cached(round(x * 10)) if x is not None else "---"
 
 
 # ── Service ─────────────────────────────────────────────────────────────────
@@ -662,17 +722,33 @@ class PowerWatchdogService:
         self._update_interval_ms = new_ms
         if self._grid_timer_id is not None:
             GLib.source_remove(self._grid_timer_id)
-        self._grid_timer_id = GLib.timeout_add(self._update_interval_ms, self._update_grid)
+        self._start_grid_timer()
         if self._grid_service is not None:
             self._grid_service["/RefreshTime"] = self._update_interval_ms
         return False  # one-shot
 
+    def _start_grid_timer(self):
+        """(Re)arm the periodic grid update timer.
+
+        Whole-second intervals (the 5000 ms default and every slider
+        stop on a second boundary) go through timeout_add_seconds so
+        glib marks the source as coarse and coalesces its wakeup with
+        other second-granularity timers — fewer wakeups on the device.
+        """
+        ms = self._update_interval_ms
+        if ms >= 1000 and ms % 1000 == 0:
+            self._grid_timer_id = GLib.timeout_add_seconds(
+                ms // 1000, self._update_grid
+            )
+        else:
+            self._grid_timer_id = GLib.timeout_add(ms, self._update_grid)
+
     # ── Device activation / deactivation (in-process BLE + grid service) ────
 
     def _mac_id_to_address(self, mac_id: str) -> str:
         if mac_id in self._device_info:
             return self._device_info[mac_id].mac
-        return ":".join(mac_id[i:i+2].upper() for i in range(0, 12, 2))
+        return _mac_from_id(mac_id)
 
     def _activate_device(self, mac_id: str):
         """Start BLE connection and register grid D-Bus service for a device."""
@@ -698,13 +774,13 @@ class PowerWatchdogService:
         )
 
         # Per-device persistent settings (role, name, position)
-        settings_path = "/Settings/Devices/power_watchdog_%s" % mac_id
+        settings_path = f"/Settings/Devices/power_watchdog_{mac_id}"
         self._grid_settings = SettingsDevice(
             bus=self._bus,
             supportedSettings={
-                "role": ["%s/Role" % settings_path, "grid", 0, 0],
-                "custom_name": ["%s/CustomName" % settings_path, "Power Watchdog", 0, 0],
-                "position": ["%s/Position" % settings_path, 0, 0, 2],
+                "role": [f"{settings_path}/Role", "grid", 0, 0],
+                "custom_name": [f"{settings_path}/CustomName", "Power Watchdog", 0, 0],
+                "position": [f"{settings_path}/Position", 0, 0, 2],
             },
             eventCallback=self._on_grid_setting_changed,
             timeout=10,
@@ -734,7 +810,7 @@ class PowerWatchdogService:
         self._last_logged_error_code = None
 
         service_class = ROLE_TO_SERVICE.get(role, ROLE_TO_SERVICE["grid"])
-        servicename = "%s.power_watchdog_%s" % (service_class, mac_id)
+        servicename = f"{service_class}.power_watchdog_{mac_id}"
         self._current_role = role
 
         # Grid service needs its own bus connection because VeDbusService
@@ -792,7 +868,7 @@ class PowerWatchdogService:
         self._grid_service = svc
         logger.info("Registered grid service as %s (role=%s)", servicename, role)
 
-        self._grid_timer_id = GLib.timeout_add(self._update_interval_ms, self._update_grid)
+        self._start_grid_timer()
 
     def _deactivate_device(self):
         """Stop BLE, tear down grid service, clear active state."""
@@ -1081,13 +1157,19 @@ def main():
 
     mainloop = GLib.MainLoop()
 
-    def signal_handler(signum, frame):
+    def signal_handler(signum):
         logger.info("Received signal %d, shutting down...", signum)
         service.stop()
         mainloop.quit()
-
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+        return GLib.SOURCE_REMOVE
+
+    # unix_signal_add dispatches from the glib poll loop itself, so
+    # shutdown starts immediately instead of waiting for control to
+    # return to Python bytecode (up to one timer tick with signal.signal).
+    GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGTERM,
+                         signal_handler, signal.SIGTERM)
+    GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGINT,
+                         signal_handler, signal.SIGINT)
 
     logger.info("dbus-power-watchdog v%s started", VERSION)
 
@@ -96,6 +96,19 @@ ERROR_MESSAGES = {
 }
 
 
+# Per-line measurement paths in _publish_line's argument order
+# (voltage, current, power, energy, frequency).  Precomputed so the
+# per-tick line publish does no string concatenation.
+_L1_PATHS = (
+    "/Ac/L1/Voltage", "/Ac/L1/Current", "/Ac/L1/Power",
+    "/Ac/L1/Energy/Forward", "/Ac/L1/Frequency",
+)
+_L2_PATHS = (
+    "/Ac/L2/Voltage", "/Ac/L2/Current", "/Ac/L2/Power",
+    "/Ac/L2/Energy/Forward", "/Ac/L2/Frequency",
+)
+
+
 def _round_to(value: float, step: float) -> float:
     """Round *value* to the nearest multiple of *step*.
 
@@ -156,6 +169,25 @@ class GridPublisher:
         ctx[path] = value
         return True
 
+    def _publish_line(self, ctx, paths, v, c, p, e, f) -> bool:
+        """Write one AC line's measurement paths from a precomputed tuple.
+
+        *paths* is ``_L1_PATHS`` or ``_L2_PATHS`` in (voltage, current,
+        power, energy, frequency) order.  Frequency is skipped while
+        the device reports 0 (not measuring), matching the per-line
+        blocks this replaces.  Returns True iff something was written.
+        """
+        put = self._set_if_changed
+        rnd = _round_to
+        p_v, p_c, p_p, p_e, p_f = paths
+        changed = put(ctx, p_v, rnd(v, GRID_VOLTAGE_STEP))
+        changed |= put(ctx, p_c, rnd(c, GRID_CURRENT_STEP))
+        changed |= put(ctx, p_p, rnd(p, GRID_POWER_STEP))
+        changed |= put(ctx, p_e, rnd(e, GRID_ENERGY_STEP))
+        if f > 0:
+            changed |= put(ctx, p_f, rnd(f, GRID_FREQ_STEP))
+        return changed
+
     def publish(self, svc, data, connected: bool) -> bool:
         """Push one ``WatchdogData`` snapshot to *svc*.
 
@@ -179,10 +211,14 @@ class GridPublisher:
 
         Returns True iff at least one path was actually written.
         """
+        # ~20 writes per cycle all funnel through _set_if_changed and
+        # _round_to; binding them once turns repeated attribute/global
+        # lookups into local loads.
+        put = self._set_if_changed
+        rnd = _round_to
+
         with svc as ctx:
-            any_changed = self._set_if_changed(
-                ctx, "/Connected", 1 if connected else 0
-            )
+            any_changed = put(ctx, "/Connected", 1 if connected else 0)
 
             if not connected:
                 # Null out everything that represents a live reading.
@@ -196,92 +232,74 @@ class GridPublisher:
                     "/Ac/Power", "/Ac/Current", "/Ac/Voltage",
                     "/Ac/Frequency",
                 ):
-                    any_changed |= self._set_if_changed(ctx, path, None)
+                    any_changed |= put(ctx, path, None)
 
                 if any_changed:
                     self._update_index = (self._update_index + 1) % 256
-                    self._set_if_changed(
-                        ctx, "/UpdateIndex", self._update_index)
+                    put(ctx, "/UpdateIndex", self._update_index)
                 return any_changed
 
             if data.timestamp > 0:
+                # Unpack each LineData once up front: every field below
+                # is used two-plus times (per-line path, totals, average)
+                # and a local LOAD_FAST beats a dataclass LOAD_ATTR.
                 l1 = data.l1
-                any_changed |= self._set_if_changed(
-                    ctx, "/Ac/L1/Voltage",
-                    _round_to(l1.voltage, GRID_VOLTAGE_STEP))
-                any_changed |= self._set_if_changed(
-                    ctx, "/Ac/L1/Current",
-                    _round_to(l1.current, GRID_CURRENT_STEP))
-                any_changed |= self._set_if_changed(
-                    ctx, "/Ac/L1/Power",
-                    _round_to(l1.power, GRID_POWER_STEP))
-                any_changed |= self._set_if_changed(
-                    ctx, "/Ac/L1/Energy/Forward",
-                    _round_to(l1.energy, GRID_ENERGY_STEP))
-                if l1.frequency > 0:
-                    any_changed |= self._set_if_changed(
-                        ctx, "/Ac/L1/Frequency",
-                        _round_to(l1.frequency, GRID_FREQ_STEP))
-
-                total_power = l1.power
-                total_current = l1.current
-                total_energy = l1.energy
-                error_code = l1.error_code
-
-                if data.has_l2:
+                has_l2 = data.has_l2
+                l1v, l1c, l1p, l1e, l1f, l1ec = (
+                    l1.voltage, l1.current, l1.power,
+                    l1.energy, l1.frequency, l1.error_code,
+                )
+                any_changed |= self._publish_line(
+                    ctx, _L1_PATHS, l1v, l1c, l1p, l1e, l1f)
+
+                total_power = l1p
+                total_current = l1c
+                total_energy = l1e
+                error_code = l1ec
+                avg_voltage = l1v
+
+                if has_l2:
                     l2 = data.l2
-                    any_changed |= self._set_if_changed(
-                        ctx, "/Ac/L2/Voltage",
-                        _round_to(l2.voltage, GRID_VOLTAGE_STEP))
-                    any_changed |= self._set_if_changed(
-                        ctx, "/Ac/L2/Current",
-                        _round_to(l2.current, GRID_CURRENT_STEP))
-                    any_changed |= self._set_if_changed(
-                        ctx, "/Ac/L2/Power",
-                        _round_to(l2.power, GRID_POWER_STEP))
-                    any_changed |= self._set_if_changed(
-                        ctx, "/Ac/L2/Energy/Forward",
-                        _round_to(l2.energy, GRID_ENERGY_STEP))
-                    if l2.frequency > 0:
-                        any_changed |= self._set_if_changed(
-                            ctx, "/Ac/L2/Frequency",
-                            _round_to(l2.frequency, GRID_FREQ_STEP))
-                    total_power += l2.power
-                    total_current += l2.current
-                    total_energy += l2.energy
-                    if l2.error_code > error_code:
-                        error_code = l2.error_code
-
-                any_changed |= self._set_if_changed(
-                    ctx, "/NrOfPhases", 2 if data.has_l2 else 1)
-                any_changed |= self._set_if_changed(
+                    l2v, l2c, l2p, l2e, l2f, l2ec = (
+                        l2.voltage, l2.current, l2.power,
+                        l2.energy, l2.frequency, l2.error_code,
+                    )
+                    any_changed |= self._publish_line(
+                        ctx, _L2_PATHS, l2v, l2c, l2p, l2e, l2f)
+                    total_power += l2p
+                    total_current += l2c
+                    total_energy += l2e
+                    if l2ec > error_code:
+                        error_code = l2ec
+                    if l2v > 0:
+                        avg_voltage = (l1v + l2v) / 2.0
+
+                any_changed |= put(
+                    ctx, "/NrOfPhases", 2 if has_l2 else 1)
+                any_changed |= put(
                     ctx, "/Ac/Power",
-                    _round_to(total_power, GRID_POWER_STEP))
-                any_changed |= self._set_if_changed(
+                    rnd(total_power, GRID_POWER_STEP))
+                any_changed |= put(
                     ctx, "/Ac/Current",
-                    _round_to(total_current, GRID_CURRENT_STEP))
-                avg_voltage = l1.voltage
-                if data.has_l2 and data.l2.voltage > 0:
-                    avg_voltage = (l1.voltage + data.l2.voltage) / 2.0
-                any_changed |= self._set_if_changed(
+                    rnd(total_current, GRID_CURRENT_STEP))
+                any_changed |= put(
                     ctx, "/Ac/Voltage",
-                    _round_to(avg_voltage, GRID_VOLTAGE_STEP))
-                if l1.frequency > 0:
-                    any_changed |= self._set_if_changed(
+                    rnd(avg_voltage, GRID_VOLTAGE_STEP))
+                if l1f > 0:
+                    any_changed |= put(
                         ctx, "/Ac/Frequency",
-                        _round_to(l1.frequency, GRID_FREQ_STEP))
-                any_changed |= self._set_if_changed(
+                        rnd(l1f, GRID_FREQ_STEP))
+                any_changed |= put(
                     ctx, "/Ac/Energy/Forward",
-                    _round_to(total_energy, GRID_ENERGY_STEP))
-                any_changed |= self._set_if_changed(
+                    rnd(total_energy, GRID_ENERGY_STEP))
+                any_changed |= put(
                     ctx, "/ErrorCode", error_code)
-                any_changed |= self._set_if_changed(
+                any_changed |= put(
                     ctx, "/ErrorMessage",
                     ERROR_MESSAGES.get(error_code, "Unknown Error %d" % error_code))
 
                 if any_changed:
                     self._update_index = (self._update_index + 1) % 256
-                    self._set_if_changed(
-                        ctx, "/UpdateIndex", self._update_index)
+                    put(ctx, "/UpdateIndex", self._update_index)
 
             return any_changed
@@ -38,8 +38,10 @@ lifecycle.  Protocol-specific parsing and handshake logic lives in the
 
 import asyncio
 import logging
+import re
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from bleak import BleakClient, BleakError
@@ -208,9 +210,13 @@ def resolve_power_watchdog_gatt(client: BleakClient) -> tuple[str, str, bool, st
 
 # ── Data model ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LineData:
-    """Parsed power data for a single AC line."""
+    """Parsed power data for a single AC line.
+
+    Frozen: parsers build a fresh instance per update and publish it by
+    reference, so snapshots handed to consumers can never mutate.
+    """
     voltage: float = 0.0        # Volts (input)
     current: float = 0.0        # Amps
     power: float = 0.0          # Watts
@@ -222,9 +228,9 @@ class LineData:
     boost: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WatchdogData:
-    """Parsed Power Watchdog data with L1/L2 support."""
+    """Parsed Power Watchdog data with L1/L2 support (immutable snapshot)."""
     l1: LineData = field(default_factory=LineData)
     l2: LineData = field(default_factory=LineData)
     has_l2: bool = False
@@ -234,9 +240,13 @@ class WatchdogData:
 
 # ── Discovery ────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredDevice:
-    """A Power Watchdog device found during BLE scanning."""
+    """A Power Watchdog device found during BLE scanning.
+
+    Slotted but not frozen: callers fill in ``mac`` after classifying
+    the advertised name.
+    """
     mac: str               # MAC address (e.g., "AA:BB:CC:DD:EE:FF")
     name: str              # BLE advertised name (e.g., "WD_E7_aabbccddeeff")
     generation: int = 0    # 1 = gen1 (BT-only), 2 = gen2 (WiFi+BT)
@@ -251,28 +261,42 @@ def _gen2_has_booster(device_type: str) -> bool:
     return len(device_type) == 2 and device_type[1] in ("8", "9")
 
 
+# Cheap first gate for scan results: one C-level prefix check rejects
+# the hundreds of unrelated devices a busy scan can return.
+_NAME_PREFIXES = (GEN2_PREFIX, GEN1_PREFIX)
+
+# Gen1 hardware version from name[15:17]: "E2"→1, "E3"→2, "E4"→3
+_GEN1_VERSIONS = {"E2": 1, "E3": 2, "E4": 3}
+
+# Gen2 name shape: WD_{type}_{serialhex}, i.e. exactly two underscores.
+# One compiled-regex match replaces the find/slice two-step.
+_GEN2_RE = re.compile(r"WD_([^_]*)_([^_]*)\Z")
+
+# Known Gen2 product lines: E/V 5 and 6 are 30 A single-line, 7/8/9 are
+# 50 A dual-line.  Set membership is one hash probe per lookup.
+_GEN2_SINGLE = frozenset({"E5", "E6", "V5", "V6"})
+_GEN2_DOUBLE = frozenset({"E7", "E8", "E9", "V7", "V8", "V9"})
+
+
 def classify_device(name: str) -> DiscoveredDevice | None:
     """Classify a BLE device name as a Power Watchdog, or return None.
 
     Gen2 (WiFi+BT): Name starts with "WD_", format "WD_{type}_{serialhex}".
     Gen1 (BT-only): Name starts with "PM", 19 or 27 chars, "PMS"=30A, "PMD"=50A.
     """
-    if not name:
+    if not name or not name.startswith(_NAME_PREFIXES):
         return None
 
-    # Gen2: WD_{type}_{serialhex}
     if name.startswith(GEN2_PREFIX):
-        parts = name.split("_")
-        if len(parts) == 3:
-            device_type = parts[1]
-            # E-types and V-types: 5/6=30A, 7/8/9=50A (based on product line)
-            line_type = "unknown"
-            if device_type and len(device_type) == 2:
-                model_num = device_type[1]
-                if model_num in ("5", "6"):
-                    line_type = "single"
-                elif model_num in ("7", "8", "9"):
-                    line_type = "double"
+        m = _GEN2_RE.match(name)
+        if m is not None:
+            device_type = m.group(1)
+            if device_type in _GEN2_SINGLE:
+                line_type = "single"
+            elif device_type in _GEN2_DOUBLE:
+                line_type = "double"
+            else:
+                line_type = "unknown"
             return DiscoveredDevice(
                 mac="",  # filled in by caller
                 name=name,
@@ -286,15 +310,13 @@ def classify_device(name: str) -> DiscoveredDevice | None:
     if name.startswith(GEN1_PREFIX):
         effective_name = name.rstrip()
         if len(effective_name) == 19:
-            third_char = effective_name[2] if len(effective_name) > 2 else ""
+            third_char = effective_name[2]
             if third_char == "S":
                 line_type = "single"
             elif third_char == "D":
                 line_type = "double"
             else:
                 line_type = "unknown"
-            # Hardware version from name[15:17]: "E2"→1, "E3"→2, "E4"→3
-            _GEN1_VERSIONS = {"E2": 1, "E3": 2, "E4": 3}
             hw_version = _GEN1_VERSIONS.get(effective_name[15:17], 0)
             return DiscoveredDevice(
                 mac="",  # filled in by caller
@@ -379,6 +401,13 @@ class PowerWatchdogBLE:
     # The device may be unplugged and will come back at any time.
     OFFLINE_POLL_INTERVAL = 300.0  # 5 minutes
 
+    # Optional new-data hook, called from the BLE thread each time a
+    # parsed telemetry snapshot is published to ``_data``.  Consumers
+    # must bridge it onto their own loop (e.g. ``GLib.idle_add``) —
+    # it runs on the daemon thread.  Class-level default so protocol
+    # modules can read it on instances that skipped ``__init__``.
+    on_data: Callable[[], None] | None = None
+
     def __init__(
         self,
         address: str,
@@ -387,10 +416,14 @@ class PowerWatchdogBLE:
         lock_config: LockConfig | None = None,
         scan_lock_config: ScanLockConfig | None = None,
         ble_adapters: list[str] | None = None,
+        capture_raw: bool = False,
     ):
         self.address = address
         self.reconnect_delay = reconnect_delay
         self.reconnect_max_delay = reconnect_max_delay
+        # Store raw frame hex in WatchdogData.raw_hex even when DEBUG
+        # logging is off (support-dump use; costs a .hex() per packet).
+        self._capture_raw = capture_raw
         # Pin scans + connections to these HCIs (e.g. ["hci1"]). None = BCM default.
         self._ble_adapters = ble_adapters
 
@@ -398,14 +431,19 @@ class PowerWatchdogBLE:
         self._lock_config = lock_config or LockConfig(enabled=True)
         self._scan_lock_config = scan_lock_config or ScanLockConfig(enabled=True)
 
+        # Published by reference swap: WatchdogData is frozen and the
+        # BLE thread is the only writer, so a GIL-atomic assignment is
+        # all the synchronization readers need.
         self._data = WatchdogData()
-        self._data_lock = threading.Lock()
         self._connected = False
         self._running = True
 
         # asyncio event loop reference (set by daemon thread)
         self._loop: asyncio.AbstractEventLoop | None = None
         self._sleep_task: asyncio.Task | None = None
+        # Set by bleak's disconnected callback / stop() to wake the
+        # keepalive wait (created per connection in _async_main).
+        self._disconnect_event: asyncio.Event | None = None
 
         # Connection watchdog (set when connected)
         self._watchdog: ConnectionWatchdog | None = None
@@ -423,35 +461,13 @@ class PowerWatchdogBLE:
         return self._connected
 
     def get_data(self) -> WatchdogData:
-        """Return a snapshot of the latest data (thread-safe)."""
-        with self._data_lock:
-            return WatchdogData(
-                l1=LineData(
-                    voltage=self._data.l1.voltage,
-                    current=self._data.l1.current,
-                    power=self._data.l1.power,
-                    energy=self._data.l1.energy,
-                    output_voltage=self._data.l1.output_voltage,
-                    frequency=self._data.l1.frequency,
-                    error_code=self._data.l1.error_code,
-                    status=self._data.l1.status,
-                    boost=self._data.l1.boost,
-                ),
-                l2=LineData(
-                    voltage=self._data.l2.voltage,
-                    current=self._data.l2.current,
-                    power=self._data.l2.power,
-                    energy=self._data.l2.energy,
-                    output_voltage=self._data.l2.output_voltage,
-                    frequency=self._data.l2.frequency,
-                    error_code=self._data.l2.error_code,
-                    status=self._data.l2.status,
-                    boost=self._data.l2.boost,
-                ),
-                has_l2=self._data.has_l2,
-                timestamp=self._data.timestamp,
-                raw_hex=self._data.raw_hex,
-            )
+        """Return the latest data snapshot (thread-safe).
+
+        WatchdogData is frozen and parsers publish whole new instances
+        with a single GIL-atomic reference swap, so the current
+        reference can be handed out as-is — no lock, no copy.
+        """
+        return self._data
 
     def stop(self, timeout: float = 5.0):
         """Signal the BLE thread to stop and wait for a clean BLE disconnect.
@@ -484,9 +500,12 @@ class PowerWatchdogBLE:
     # ── Daemon thread ───────────────────────────────────────────────────────
 
     def _cancel_sleep(self):
-        """Cancel the current sleep task so the thread can exit promptly."""
+        """Cancel the current sleep and wake the keepalive wait so the
+        thread can exit promptly."""
         if self._sleep_task is not None and not self._sleep_task.done():
             self._sleep_task.cancel()
+        if self._disconnect_event is not None:
+            self._disconnect_event.set()
 
     def _run_loop(self):
         """Daemon thread entry point: run asyncio event loop."""
@@ -565,10 +584,20 @@ class PowerWatchdogBLE:
                     "Connecting to Power Watchdog %s...", self.address,
                 )
 
+                # Event-driven keepalive: the disconnected callback
+                # (and stop()) set this, so the loop parks until the
+                # link actually drops instead of polling every second.
+                disconnect_event = asyncio.Event()
+                self._disconnect_event = disconnect_event
+                loop = asyncio.get_running_loop()
+
                 client = await establish_connection(
                     BleakClient,
                     device,
                     "Power Watchdog %s" % self.address,
+                    disconnected_callback=lambda _client: (
+                        loop.call_soon_threadsafe(disconnect_event.set)
+                    ),
                     max_attempts=4,
                     adapters=self._ble_adapters,
                     close_inactive_connections=True,
@@ -587,17 +616,21 @@ class PowerWatchdogBLE:
                 self._connected = True
                 delay = self.reconnect_delay
 
-                n_svc = sum(1 for _ in client.services)
-                n_char = sum(
-                    len(svc.characteristics) for svc in client.services
-                )
-                logger.debug(
-                    "GATT table for %s (%d services, %d characteristics):\n%s",
-                    self.address,
-                    n_svc,
-                    n_char,
-                    format_gatt_snapshot(client),
-                )
+                # format_gatt_snapshot walks every characteristic even
+                # when the message is ultimately discarded, so only pay
+                # for it when DEBUG is actually on.
+                if logger.isEnabledFor(logging.DEBUG):
+                    n_svc = sum(1 for _ in client.services)
+                    n_char = sum(
+                        len(svc.characteristics) for svc in client.services
+                    )
+                    logger.debug(
+                        "GATT table for %s (%d services, %d characteristics):\n%s",
+                        self.address,
+                        n_svc,
+                        n_char,
+                        format_gatt_snapshot(client),
+                    )
 
                 notify_uuid, write_uuid, write_resp, gatt_mode = (
                     resolve_power_watchdog_gatt(client)
@@ -649,9 +682,9 @@ class PowerWatchdogBLE:
                 )
                 self._watchdog.start()
 
-                # Step 5: Stay connected while client is alive
-                while client.is_connected and self._running:
-                    await self._interruptible_sleep(1.0)
+                # Step 5: Park until the link drops or stop() is called
+                if client.is_connected and self._running:
+                    await disconnect_event.wait()
 
                 self._connected = False
                 if not self._running:
@@ -709,11 +742,17 @@ class PowerWatchdogBLE:
             NOTIFICATION_WATCHDOG_TIMEOUT, self.address,
         )
         self._connected = False
+        # Wake the keepalive wait in case the disconnect performed by
+        # the watchdog does not surface a disconnected callback.
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_sleep)
 
     async def _interruptible_sleep(self, seconds: float):
         """Sleep that can be cancelled by stop()."""
         try:
-            self._sleep_task = asyncio.ensure_future(asyncio.sleep(seconds))
+            # create_task is cheaper than ensure_future here: the argument
+            # is always a coroutine, so the type inspection is wasted work.
+            self._sleep_task = asyncio.create_task(asyncio.sleep(seconds))
             await self._sleep_task
         except asyncio.CancelledError:
             pass
@@ -34,8 +34,10 @@ import os
 import platform
 import signal
 import sys
+from functools import lru_cache
 
 import dbus
+import dbus.service
 from gi.repository import GLib
 from dbus.mainloop.glib import DBusGMainLoop
 
@@ -95,20 +97,45 @@ def get_bus() -> dbus.bus.BusConnection:
 
 # ── Formatters ──────────────────────────────────────────────────────────────
 
+# GUI reads hit these for every exported path on every poll, and
+# readings repeat for long stretches; memoizing the string building on
+# the display-precision rounding turns repeat reads into a dict hit
+# that returns the same interned string.
+
+@lru_cache(maxsize=1024)
+def _fmt_w_cached(n: int) -> str:
+    return "%dW" % n
+
+@lru_cache(maxsize=1024)
+def _fmt_v_cached(n: int) -> str:
+    return "%.1fV" % (n / 10)
+
+@lru_cache(maxsize=1024)
+def _fmt_a_cached(n: int) -> str:
+    return "%.2fA" % (n / 100)
+
+@lru_cache(maxsize=1024)
+def _fmt_kwh_cached(n: int) -> str:
+    return "%.2fkWh" % (n / 100)
+
+@lru_cache(maxsize=1024)
+def _fmt_hz_cached(n: int) -> str:
+    return "%.1fHz" % (n / 10)
+
 def _fmt_w(_path, x):
-    return "{:.0f}W".format(x) if x is not None else "---"
+    return _fmt_w_cached(round(x)) if x is not None else "---"
 
 def _fmt_v(_path, x):
-    return "{:.1f}V".format(x) if x is not None else "---"
+    return _fmt_v_cached(round(x * 10)) if x is not None else "---"
 
 def _fmt_a(_path, x):
-    return "{:.2f}A".format(x) if x is not None else "---"
+    return _fmt_a_cached(round(x * 100)) if x is not None else "---"
 
 def _fmt_kwh(_path, x):
-    return "{:.2f}kWh".format(x) if x is not None else "---"
+    return _fmt_kwh_cached(round(x * 100)) if x is not None else "---"
 
 def _fmt_hz(_path, x):
-    return "{:.1f}Hz".format(x) if x is not None else "---"
+    return _fmt_hz_cached(round(x * 10)) if x is not None else "---"
 
 
 # ── Service ─────────────────────────────────────────────────────────────────
@@ -116,6 +143,49 @@ def _fmt_hz(_path, x):
 class PowerWatchdogDeviceService:
     """Venus OS D-Bus grid meter service for a single Power Watchdog BLE device."""
 
+    # Slotted: one long-lived instance per process, but every self._x
+    # in the publish path becomes a fixed-offset load instead of a
+    # __dict__ hash lookup.
+    __slots__ = (
+        "_mac_address", "_mac_id", "_update_interval_ms",
+        "_device_instance", "_ble", "_bus", "_settings",
+        "_dbusservice", "_timer_id", "_current_role",
+        "_pending_settings", "_flush_scheduled",
+        "_grid_publisher", "_last_logged_error_code",
+    )
+
+    # Measurement paths with fixed defaults: (path, default, formatter).
+    # Registered in one loop by _create_service; paths whose defaults
+    # come from live settings (/CustomName, /Role, /Position, ...) stay
+    # explicit there.
+    _PATH_SPEC = (
+        # AC totals
+        ("/Ac/Power", None, _fmt_w),
+        ("/Ac/Current", None, _fmt_a),
+        ("/Ac/Voltage", None, _fmt_v),
+        ("/Ac/Frequency", None, _fmt_hz),
+        ("/Ac/Energy/Forward", None, _fmt_kwh),
+        ("/Ac/Energy/Reverse", 0, None),
+        # L1
+        ("/Ac/L1/Voltage", None, _fmt_v),
+        ("/Ac/L1/Current", None, _fmt_a),
+        ("/Ac/L1/Power", None, _fmt_w),
+        ("/Ac/L1/Energy/Forward", None, _fmt_kwh),
+        ("/Ac/L1/Energy/Reverse", 0, None),
+        ("/Ac/L1/Frequency", None, _fmt_hz),
+        # L2 (populated only on 50A dual-line models)
+        ("/Ac/L2/Voltage", None, _fmt_v),
+        ("/Ac/L2/Current", None, _fmt_a),
+        ("/Ac/L2/Power", None, _fmt_w),
+        ("/Ac/L2/Energy/Forward", None, _fmt_kwh),
+        ("/Ac/L2/Energy/Reverse", 0, None),
+        ("/Ac/L2/Frequency", None, _fmt_hz),
+        # Error code + human-readable message (publisher writes both
+        # when the active service has these paths declared).
+        ("/ErrorCode", 0, None),
+        ("/ErrorMessage", "", None),
+    )
+
     def __init__(self, mac_address: str, adapter: str = "",
                  update_interval_ms: int = 5000,
                  reconnect_delay: float = 10.0,
@@ -123,6 +193,11 @@ class PowerWatchdogDeviceService:
         self._mac_address = mac_address
         self._mac_id = mac_address.replace(":", "").lower()
         self._update_interval_ms = update_interval_ms
+        # DeviceInstance: hash the MAC to get a stable, unique instance
+        # number in range 40-299 (avoids conflicts with other devices).
+        # The MAC never changes, so compute it once here rather than on
+        # every role-driven service recreate.
+        self._device_instance = 40 + (int(self._mac_id, 16) % 260)
 
         logger.info("Power Watchdog MAC: %s", self._mac_address)
         ble_adapters = [adapter.strip()] if adapter.strip() else None
@@ -149,17 +224,19 @@ class PowerWatchdogDeviceService:
         self._bus = get_bus()
 
         # Persistent settings via com.victronenergy.settings (localsettings)
-        settings_path = "/Settings/Devices/power_watchdog_%s" % self._mac_id
+        settings_path = f"/Settings/Devices/power_watchdog_{self._mac_id}"
         global_path = "/Settings/Devices/power_watchdog"
+        # Share the main connection: SettingsDevice only adds signal
+        # matches and proxies, it claims no names, so a private bus
+        # would just cost an extra fd and auth/hello roundtrip.
         self._settings = SettingsDevice(
-            bus=dbus.SystemBus(private=True) if "DBUS_SESSION_BUS_ADDRESS" not in os.environ
-                else dbus.SessionBus(private=True),
+            bus=self._bus,
             supportedSettings={
-                "role": ["%s/Role" % settings_path, "grid", 0, 0],
-                "custom_name": ["%s/CustomName" % settings_path, "Power Watchdog", 0, 0],
-                "position": ["%s/Position" % settings_path, 0, 0, 2],
+                "role": [f"{settings_path}/Role", "grid", 0, 0],
+                "custom_name": [f"{settings_path}/CustomName", "Power Watchdog", 0, 0],
+                "position": [f"{settings_path}/Position", 0, 0, 2],
                 "poll_interval_ms": [
-                    "%s/PollIntervalMs" % global_path,
+                    f"{global_path}/PollIntervalMs",
                     update_interval_ms,  # default from CLI arg
                     100,   # min
                     10000, # max
@@ -184,6 +261,11 @@ class PowerWatchdogDeviceService:
         self._timer_id = None
         self._current_role = None
 
+        # Localsettings writes queued by the change callbacks, flushed
+        # once per main-loop idle (see _queue_setting).
+        self._pending_settings: dict = {}
+        self._flush_scheduled = False
+
         # Shared publisher: owns the rolling /UpdateIndex counter and
         # the in-RAM dedup cache.  Reset on service teardown / role
         # change so a fresh ``VeDbusService`` starts with empty state.
@@ -202,8 +284,57 @@ class PowerWatchdogDeviceService:
             role = "grid"
         self._create_service(role)
 
+        # Push-driven publishing: the BLE thread signals each parsed
+        # frame and GLib.idle_add bridges it onto the main loop, so
+        # D-Bus sees one write batch per real sample instead of one per
+        # timer tick.  (idle_add is the documented thread-safe way to
+        # hand work to the GLib main loop.)
+        self._ble.on_data = lambda: GLib.idle_add(self._publish)
+
+    def _apply_role(self, role: str):
+        """Switch the service to *role*, in place when possible.
+
+        Only the claimed bus name and /Role actually depend on the
+        role — the ~30 exported paths are role-invariant.  So claim
+        the new name on the existing connection and let the old
+        ``BusName`` release when dropped, keeping the object tree, the
+        timer and the publisher's dedup cache alive.  Anything
+        unexpected falls back to the full teardown/recreate path.
+        """
+        if role == self._current_role or self._dbusservice is None:
+            return self._create_service(role)
+        try:
+            if not isinstance(
+                getattr(self._dbusservice, "_dbusname", None),
+                dbus.service.BusName,
+            ):
+                # vedbus internals changed; take the safe path.
+                raise TypeError("unexpected VeDbusService bus-name attribute")
+            service_class = ROLE_TO_SERVICE.get(role, ROLE_TO_SERVICE["grid"])
+            servicename = f"{service_class}.power_watchdog_{self._mac_id}"
+            # Claim the new name before dropping the old one so the
+            # device never disappears from the bus in between.
+            new_busname = dbus.service.BusName(
+                servicename, self._bus, do_not_queue=True,
+            )
+            self._dbusservice._dbusname = new_busname  # old name released
+            self._dbusservice["/Role"] = role
+            self._current_role = role
+            logger.info(
+                "Role switched in place to %s (now %s)", role, servicename,
+            )
+        except Exception:
+            logger.exception(
+                "In-place role switch to %s failed, recreating service", role,
+            )
+            self._create_service(role)
+
     def _create_service(self, role: str):
         """Create (or re-create) the D-Bus service for the given role."""
+        if role == self._current_role and self._dbusservice is not None:
+            # A same-role request would tear down and re-register all
+            # ~30 paths for nothing; the existing service is correct.
+            return
         if self._dbusservice is not None:
             # Tear down the existing service
             if self._timer_id is not None:
@@ -215,7 +346,7 @@ class PowerWatchdogDeviceService:
 
         service_class = ROLE_TO_SERVICE.get(role, ROLE_TO_SERVICE["grid"])
         # Use MAC-based suffix for unique service name per device
-        servicename = "%s.power_watchdog_%s" % (service_class, self._mac_id)
+        servicename = f"{service_class}.power_watchdog_{self._mac_id}"
         self._current_role = role
 
         self._dbusservice = VeDbusService(servicename, self._bus, register=False)
@@ -230,10 +361,7 @@ class PowerWatchdogDeviceService:
         )
 
         # Mandatory device paths
-        # DeviceInstance: hash the MAC to get a stable, unique instance number
-        # Use range 40-299 to avoid conflicts with other devices
-        device_instance = 40 + (int(self._mac_id, 16) % 260)
-        self._dbusservice.add_path("/DeviceInstance", device_instance)
+        self._dbusservice.add_path("/DeviceInstance", self._device_instance)
         self._dbusservice.add_path("/ProductId", 0xFFFF)
         self._dbusservice.add_path("/ProductName", "Hughes Power Watchdog")
         self._dbusservice.add_path("/CustomName", self._settings["custom_name"],
@@ -262,34 +390,10 @@ class PowerWatchdogDeviceService:
         # Refresh time (measurement interval in ms)
         self._dbusservice.add_path("/RefreshTime", self._update_interval_ms)
 
-        # AC total paths
-        self._dbusservice.add_path("/Ac/Power", None, gettextcallback=_fmt_w)
-        self._dbusservice.add_path("/Ac/Current", None, gettextcallback=_fmt_a)
-        self._dbusservice.add_path("/Ac/Voltage", None, gettextcallback=_fmt_v)
-        self._dbusservice.add_path("/Ac/Frequency", None, gettextcallback=_fmt_hz)
-        self._dbusservice.add_path("/Ac/Energy/Forward", None, gettextcallback=_fmt_kwh)
-        self._dbusservice.add_path("/Ac/Energy/Reverse", 0)
-
-        # L1 paths
-        self._dbusservice.add_path("/Ac/L1/Voltage", None, gettextcallback=_fmt_v)
-        self._dbusservice.add_path("/Ac/L1/Current", None, gettextcallback=_fmt_a)
-        self._dbusservice.add_path("/Ac/L1/Power", None, gettextcallback=_fmt_w)
-        self._dbusservice.add_path("/Ac/L1/Energy/Forward", None, gettextcallback=_fmt_kwh)
-        self._dbusservice.add_path("/Ac/L1/Energy/Reverse", 0)
-        self._dbusservice.add_path("/Ac/L1/Frequency", None, gettextcallback=_fmt_hz)
-
-        # L2 paths (populated only on 50A dual-line models)
-        self._dbusservice.add_path("/Ac/L2/Voltage", None, gettextcallback=_fmt_v)
-        self._dbusservice.add_path("/Ac/L2/Current", None, gettextcallback=_fmt_a)
-        self._dbusservice.add_path("/Ac/L2/Power", None, gettextcallback=_fmt_w)
-        self._dbusservice.add_path("/Ac/L2/Energy/Forward", None, gettextcallback=_fmt_kwh)
-        self._dbusservice.add_path("/Ac/L2/Energy/Reverse", 0)
-        self._dbusservice.add_path("/Ac/L2/Frequency", None, gettextcallback=_fmt_hz)
-
-        # Error code + human-readable message (publisher writes both
-        # when the active service has these paths declared).
-        self._dbusservice.add_path("/ErrorCode", 0)
-        self._dbusservice.add_path("/ErrorMessage", "")
+        # Measurement and error paths, declared once in _PATH_SPEC
+        add_path = self._dbusservice.add_path
+        for path, default, fmt in self._PATH_SPEC:
+            add_path(path, default, gettextcallback=fmt)
 
         # /UpdateIndex (0-255 rolling counter) — the GridPublisher
         # owns the actual increment cadence and resets in lockstep
@@ -302,11 +406,36 @@ class PowerWatchdogDeviceService:
         self._dbusservice.register()
         logger.info("Registered on D-Bus as %s (role=%s)", servicename, role)
 
-        # Set up periodic update via GLib timer (milliseconds)
-        self._timer_id = GLib.timeout_add(self._update_interval_ms, self._update)
+        # Publishing is data-driven (see on_data wiring in __init__);
+        # this timer is only a 1 Hz liveness fallback that keeps
+        # /Connected and the disconnect nulling current when no BLE
+        # frames are arriving.  timeout_add_seconds lets glib coalesce
+        # the wakeup with other second-granularity sources.
+        self._timer_id = GLib.timeout_add_seconds(1, self._liveness)
 
     # ── Settings callbacks ──────────────────────────────────────────────────
 
+    def _queue_setting(self, key: str, value):
+        """Queue a localsettings write, coalescing onto the next idle.
+
+        GUI edits (e.g. dragging a slider) can fire a change callback
+        many times per second, and each ``self._settings[key] = value``
+        is a synchronous localsettings roundtrip.  Only the last value
+        per key matters, so batch them and write once per idle.
+        """
+        self._pending_settings[key] = value
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_settings)
+
+    def _flush_settings(self) -> bool:
+        """Idle callback: write all queued settings in one pass."""
+        pending, self._pending_settings = self._pending_settings, {}
+        self._flush_scheduled = False
+        for key, value in pending.items():
+            self._settings[key] = value
+        return False  # one-shot
+
     def _on_role_changed(self, path, value):
         """Called when the GUI writes to /Role on our D-Bus service."""
         if value not in ALLOWED_ROLES:
@@ -316,14 +445,14 @@ class PowerWatchdogDeviceService:
             return True
 
         logger.info("Role change requested: %s -> %s", self._current_role, value)
-        self._settings["role"] = value
-        GLib.idle_add(self._create_service, value)
+        self._queue_setting("role", value)
+        GLib.idle_add(self._apply_role, value)
         return True
 
     def _on_custom_name_changed(self, path, value):
         """Called when the GUI writes to /CustomName on our D-Bus service."""
         logger.info("CustomName changed to '%s'", value)
-        self._settings["custom_name"] = value
+        self._queue_setting("custom_name", value)
         return True
 
     def _on_position_changed(self, path, value):
@@ -331,7 +460,7 @@ class PowerWatchdogDeviceService:
         if value not in (0, 1, 2):
             return False
         logger.info("Position changed to %d", value)
-        self._settings["position"] = value
+        self._queue_setting("position", value)
         return True
 
     def _handle_setting_changed(self, setting, oldvalue, newvalue):
@@ -340,38 +469,42 @@ class PowerWatchdogDeviceService:
 
         if setting == "role" and newvalue != self._current_role:
             if newvalue in ALLOWED_ROLES:
-                GLib.idle_add(self._create_service, newvalue)
+                GLib.idle_add(self._apply_role, newvalue)
         elif setting == "custom_name" and self._dbusservice is not None:
             self._dbusservice["/CustomName"] = newvalue
         elif setting == "position" and self._dbusservice is not None:
             self._dbusservice["/Position"] = newvalue
         elif setting == "poll_interval_ms":
-            self._reschedule_timer(int(newvalue))
+            self._set_refresh_time(int(newvalue))
+
+    def _set_refresh_time(self, new_ms: int):
+        """Record a changed polling-interval setting.
 
-    def _reschedule_timer(self, new_ms: int):
-        """Change the polling interval without restarting BLE."""
+        Publishing is data-driven now, so the interval no longer feeds
+        a timer; it survives only as /RefreshTime metadata for the GUI.
+        """
         new_ms = max(100, min(new_ms, 10000))
         if new_ms == self._update_interval_ms:
             return
         logger.info("Polling interval changed: %dms -> %dms", self._update_interval_ms, new_ms)
         self._update_interval_ms = new_ms
-        # Cancel existing timer and start a new one at the new rate
-        if self._timer_id is not None:
-            GLib.source_remove(self._timer_id)
-        self._timer_id = GLib.timeout_add(self._update_interval_ms, self._update)
-        # Update the D-Bus RefreshTime path
         if self._dbusservice is not None:
             self._dbusservice["/RefreshTime"] = self._update_interval_ms
 
     # ── Update loop ─────────────────────────────────────────────────────────
 
-    def _update(self) -> bool:
-        """Called periodically by GLib to push BLE data to D-Bus.
+    def _publish(self) -> bool:
+        """Push the latest BLE data to D-Bus.
 
-        Delegates the actual write to ``GridPublisher.publish`` which
-        owns batched writes, coarse rounding, in-RAM dedup, and
+        Scheduled via GLib.idle_add from the BLE thread's on_data hook
+        (one run per received frame) and reused by the 1 Hz liveness
+        timer.  Delegates the actual write to ``GridPublisher.publish``
+        which owns batched writes, coarse rounding, in-RAM dedup, and
         /UpdateIndex gating — see ``grid_publisher.py``.
         """
+        if self._dbusservice is None:
+            # Mid role-flip teardown; the new service republishes.
+            return False
         data = self._ble.get_data()
         connected = self._ble.connected
         self._grid_publisher.publish(self._dbusservice, data, connected)
@@ -401,6 +534,16 @@ class PowerWatchdogDeviceService:
                     )
                 self._last_logged_error_code = error_code
 
+        return False  # one-shot idle source
+
+    def _liveness(self) -> bool:
+        """1 Hz fallback publish between BLE frames.
+
+        Keeps /Connected honest and triggers the publisher's
+        null-on-disconnect when the stream stops; the dedup cache makes
+        the call near-free while data is unchanged.
+        """
+        self._publish()
         return True  # keep timer running
 
     def stop(self):
@@ -451,13 +594,19 @@ def main():
 
     mainloop = GLib.MainLoop()
 
-    def signal_handler(signum, frame):
+    def signal_handler(signum):
         logger.info("Received signal %d, shutting down...", signum)
         service.stop()
         mainloop.quit()
-
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+        return GLib.SOURCE_REMOVE
+
+    # unix_signal_add dispatches from the glib poll loop itself, so
+    # shutdown starts immediately instead of waiting for control to
+    # return to Python bytecode (up to one timer tick with signal.signal).
+    GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGTERM,
+                         signal_handler, signal.SIGTERM)
+    GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGINT,
+                         signal_handler, signal.SIGINT)
 
     logger.info(
         "power-watchdog-device v%s started for %s",
@@ -57,6 +57,8 @@ if TYPE_CHECKING:
     from bleak import BleakClient
     from power_watchdog_ble import PowerWatchdogBLE
 
+from dataclasses import replace
+
 from power_watchdog_ble import LineData
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,10 @@ GEN1_CHUNK_SIZE = 20           # each BLE notification is exactly 20 bytes
 GEN1_MERGED_SIZE = 40          # two chunks merged
 GEN1_HEADER = bytes([0x01, 0x03, 0x20])  # first chunk sentinel
 
+# Called once per frame; module-level binding skips the time-module
+# attribute lookup.
+_monotonic = time.monotonic
+
 
 # ── Protocol class ──────────────────────────────────────────────────────────
 
@@ -98,13 +104,16 @@ class Gen1Protocol:
                     )
                 elif (classified.hw_version == 1
                       and classified.line_type == "double"):
-                    ble._data.has_l2 = True
+                    ble._data = replace(ble._data, has_l2=True)
                     logger.info(
                         "Gen1 v1 dual-line detected from BLE name — "
                         "pre-setting has_l2",
                     )
 
-    def notification_handler(self, ble: PowerWatchdogBLE, _sender, data: bytearray) -> None:
+    def notification_handler(
+        self, ble: PowerWatchdogBLE, _sender,
+        data: bytes | bytearray | memoryview,
+    ) -> None:
         """Reassemble 20-byte chunk pairs into 40-byte telemetry frames."""
         if len(data) != GEN1_CHUNK_SIZE:
             logger.debug(
@@ -160,42 +169,51 @@ def parse_gen1_telemetry(ble: PowerWatchdogBLE, buf: bytes) -> None:
 
     line_markers = (buf[37], buf[38], buf[39])
 
-    ld = LineData(
-        voltage=voltage,
-        current=current,
-        power=power,
-        energy=energy,
-        frequency=frequency,
-        error_code=error_code,
-    )
+    # Positional construction (field order: voltage, current, power,
+    # energy, output_voltage, frequency, error_code) skips the kwargs
+    # dict per frame; gen1 has no booster so output_voltage is 0.
+    ld = LineData(voltage, current, power, energy, 0.0, frequency, error_code)
 
-    raw_hex = buf.hex()
+    # Hex of the frame is for debugging/support dumps only; skip the
+    # formatting when nobody will see it.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    capture = debug or getattr(ble, "_capture_raw", False)
+    raw_hex = buf.hex() if capture else ""
     is_l1 = True
-
-    with ble._data_lock:
-        if line_markers == (1, 1, 1):
-            # v2/v3 L2 marker — also locks version inference
-            ble._gen1_is_v2v3 = True
-            ble._data.l2 = ld
-            ble._data.has_l2 = True
+    # Monotonic received-at stamp: consumers only check freshness,
+    # not wall-clock.
+    ts = _monotonic()
+
+    # The BLE thread is the only writer, so the current snapshot can be
+    # read and the replacement built freely; publishing is a single
+    # GIL-atomic reference swap.
+    data = ble._data
+    if line_markers == (1, 1, 1):
+        # v2/v3 L2 marker — also locks version inference
+        ble._gen1_is_v2v3 = True
+        new = replace(data, l2=ld, has_l2=True, timestamp=ts, raw_hex=raw_hex)
+        is_l1 = False
+    elif getattr(ble, "_gen1_is_v2v3", False):
+        # v2/v3 device: everything except (1,1,1) is L1
+        new = replace(data, l1=ld, timestamp=ts, raw_hex=raw_hex)
+    elif line_markers == (0, 0, 0):
+        # v1: (0,0,0) is L2 only when dual-line is confirmed
+        if data.has_l2:
+            new = replace(data, l2=ld, timestamp=ts, raw_hex=raw_hex)
             is_l1 = False
-        elif getattr(ble, "_gen1_is_v2v3", False):
-            # v2/v3 device: everything except (1,1,1) is L1
-            ble._data.l1 = ld
-        elif line_markers == (0, 0, 0):
-            # v1: (0,0,0) is L2 only when dual-line is confirmed
-            if ble._data.has_l2:
-                ble._data.l2 = ld
-                is_l1 = False
-            else:
-                ble._data.l1 = ld
         else:
-            # v1: non-zero marker confirms dual-line, frame is L1
-            ble._data.l1 = ld
-            ble._data.has_l2 = True
-        ble._data.timestamp = time.time()
-        ble._data.raw_hex = raw_hex
+            new = replace(data, l1=ld, timestamp=ts, raw_hex=raw_hex)
+    else:
+        # v1: non-zero marker confirms dual-line, frame is L1
+        new = replace(data, l1=ld, has_l2=True, timestamp=ts, raw_hex=raw_hex)
+
+    ble._data = new
+    cb = ble.on_data
+    if cb is not None:
+        cb()
 
+    if not debug:
+        return
     logger.debug(
         "Gen1 L%s: %.1fV %.2fA %.1fW %.3fkWh %.1fHz err=%d markers=%s",
         "1" if is_l1 else "2",
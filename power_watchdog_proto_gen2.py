@@ -39,7 +39,9 @@ if TYPE_CHECKING:
     from bleak import BleakClient
     from power_watchdog_ble import PowerWatchdogBLE
 
-from power_watchdog_ble import LineData, _gen2_has_booster
+from dataclasses import replace
+
+from power_watchdog_ble import LineData, WatchdogData, _gen2_has_booster
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +61,34 @@ CMD_ALARM = 14
 
 DL_DATA_SIZE = 34  # bytes per AC line
 
+# Compact the RX buffer only once this many consumed bytes pile up in
+# front of the read offset; amortizes the memmove instead of paying it
+# on every packet.
+COMPACT_THRESHOLD = MAX_BUFFER_SIZE // 2
+
+# Magic as raw bytes so the RX scan can use bytearray.find (C-level
+# search) instead of a Python byte loop.
+_MAGIC = PACKET_IDENTIFIER.to_bytes(4, "big")
+
+# Precompiled Struct: one C call per DLData block, no per-call format
+# string parsing.  Header and tail fields are tiny (1-2 bytes) and read
+# with shift-OR byte indexing instead, which skips Struct's tuple build.
+# Whole DLData block in one unpack: v/i/p/e int32s, skip temp1, outputV
+# int32, backlight/neutral/boost/temp bytes, frequency int32, err/status.
+_DL_FMT = "iiiixxxxiBBBBiBB"
+_DL_STRUCT = struct.Struct(">" + _DL_FMT)          # .size == DL_DATA_SIZE
+_DL2_STRUCT = struct.Struct(">" + _DL_FMT * 2)     # both lines in one call
+_DL_NFIELDS = 12  # values yielded per line by the format above
+
+# Scaling as multiply-by-reciprocal: FMUL is cheaper than FDIV and the
+# constants avoid repeated literal→float conversions in the hot path.
+_SCALE_1E4 = 1e-4   # raw /10000 fields
+_SCALE_1E2 = 1e-2   # raw /100 fields (frequency)
+
+# Called once per packet; module-level binding skips the time-module
+# attribute lookup.
+_monotonic = time.monotonic
+
 
 # ── Protocol class ──────────────────────────────────────────────────────────
 
@@ -69,8 +99,15 @@ class Gen2Protocol:
         self, ble: PowerWatchdogBLE, device_name: str | None = None,
     ) -> None:
         """Reset protocol-specific state on the BLE instance for a new connection."""
-        ble._rx_buffer = bytearray()
+        # Preallocated scratch buffer: notifications are written at the
+        # _rx_len watermark and consumed by advancing _rx_pos, so
+        # steady-state RX never reallocates.
+        ble._rx_buffer = bytearray(MAX_BUFFER_SIZE)
+        ble._rx_pos = 0
+        ble._rx_len = 0
         ble._logged_bad_tail = False
+        ble._parse_dl = _parse_dl_report
+        ble._last_body = None
 
         # Detect booster capability from device name (e.g. "WD_E8_...")
         ble._has_booster = False
@@ -80,17 +117,136 @@ class Gen2Protocol:
                 ble._has_booster = _gen2_has_booster(parts[1])
         logger.info("Gen2 booster capability: %s", ble._has_booster)
 
-    def notification_handler(self, ble: PowerWatchdogBLE, _sender, data: bytearray) -> None:
-        """Buffer incoming bytes and extract framed packets."""
-        ble._rx_buffer.extend(data)
+    def notification_handler(
+        self, ble: PowerWatchdogBLE, _sender,
+        data: bytes | bytearray | memoryview,
+    ) -> None:
+        """Buffer incoming bytes and drain all complete framed packets.
+
+        The drain loop is inlined here rather than dispatching through a
+        per-packet helper method: one notification often carries several
+        small packets at MTU 230, and the repeated method dispatch adds
+        up under reconnect bursts.  Hot names are bound to locals.
+
+        The RX buffer is preallocated at MAX_BUFFER_SIZE: incoming
+        bytes are slice-assigned at the ``_rx_len`` watermark and
+        consumed by advancing the ``_rx_pos`` read offset, so the
+        steady-state path never reallocates; the live region is slid to
+        the front only when COMPACT_THRESHOLD consumed bytes accumulate
+        or the tail runs out of room.
+        """
+        buf = ble._rx_buffer
+        pos = ble._rx_pos
+        end = ble._rx_len
+        n = len(data)
+
+        if end + n > MAX_BUFFER_SIZE:
+            # Make room by sliding the live region to the front.
+            if pos:
+                buf[: end - pos] = buf[pos:end]
+                end -= pos
+                pos = 0
+            if end + n > MAX_BUFFER_SIZE:
+                # A pending frame larger than the buffer can never
+                # complete; drop everything, as before.
+                logger.warning(
+                    "RX buffer overflow (%d bytes pending), clearing", end,
+                )
+                ble._rx_pos = 0
+                ble._rx_len = 0
+                return
+
+        buf[end : end + n] = data
+        end += n
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        capture = debug or getattr(ble, "_capture_raw", False)
+        find = buf.find
+        # Zero-copy view over the buffer: body slices of it go straight
+        # into Struct.unpack_from without the bytes() copy per packet.
+        # All buffer writes are same-size slice assignments now, so live
+        # views cannot trip a resize; releasing them is just hygiene.
+        mv = memoryview(buf)
+        while True:
+            # Seek to the packet identifier, discarding leading garbage.
+            idx = find(_MAGIC, pos, end)
+            if idx < 0:
+                # Keep up to 3 trailing bytes: they may be a magic
+                # prefix split across notifications.
+                keep = end - 3
+                if keep > pos:
+                    pos = keep
+                break
+            pos = idx
+
+            if end - pos < HEADER_SIZE:
+                break
+
+            cmd = buf[pos + 6]
+            data_len = (buf[pos + 7] << 8) | buf[pos + 8]
+
+            if data_len > MAX_BUFFER_SIZE:
+                logger.warning("Invalid dataLen %d, discarding", data_len)
+                pos += 4
+                continue
 
-        if len(ble._rx_buffer) > MAX_BUFFER_SIZE:
-            logger.warning("RX buffer overflow (%d bytes), clearing", len(ble._rx_buffer))
-            ble._rx_buffer.clear()
-            return
+            total_len = HEADER_SIZE + data_len + TAIL_SIZE
 
-        while self._try_parse_packet(ble):
-            pass
+            if end - pos < total_len:
+                break
+
+            body_end = pos + HEADER_SIZE + data_len
+            body = mv[pos + HEADER_SIZE : body_end]
+            tail = (buf[body_end] << 8) | buf[body_end + 1]
+            # Hex of the raw frame is for debugging/support dumps
+            # only; skip the copy + format when nobody will see it.
+            raw_hex = buf[pos : pos + total_len].hex() if capture else ""
+            pos += total_len
+
+            if tail != PACKET_TAIL:
+                body.release()
+                if not getattr(ble, "_logged_bad_tail", False):
+                    ble._logged_bad_tail = True
+                    hx = buf[pos - total_len : pos].hex()[:200]
+                    hx += "..." if total_len * 2 > 200 else ""
+                    logger.warning(
+                        "Bad packet tail 0x%04X (expected 0x%04X); "
+                        "cmd=%d data_len=%d frame_hex_prefix=%s",
+                        tail, PACKET_TAIL, cmd, data_len, hx,
+                    )
+                else:
+                    logger.debug(
+                        "Bad packet tail 0x%04X (expected 0x%04X)",
+                        tail, PACKET_TAIL,
+                    )
+                continue
+
+            wd = getattr(ble, "_watchdog", None)
+            if wd is not None:
+                wd.notify_activity()
+
+            try:
+                if cmd == CMD_DL_REPORT:
+                    ble._parse_dl(ble, body, raw_hex)
+                elif cmd == CMD_ERROR_REPORT:
+                    logger.debug("ErrorReport received (%d bytes body)", len(body))
+                elif cmd == CMD_ALARM:
+                    logger.warning("Alarm notification received from Power Watchdog")
+                else:
+                    logger.debug("Unknown cmd %d (%d bytes body)", cmd, len(body))
+            finally:
+                body.release()
+
+        mv.release()
+        if pos >= end:
+            pos = 0
+            end = 0
+        elif pos > COMPACT_THRESHOLD:
+            buf[: end - pos] = buf[pos:end]
+            end -= pos
+            pos = 0
+        ble._rx_pos = pos
+        ble._rx_len = end
 
     async def after_subscribe(
         self, client: BleakClient, write_uuid: str, write_resp: bool,
@@ -118,114 +274,105 @@ class Gen2Protocol:
             PACKET_IDENTIFIER,
         )
 
-    # ── Packet parsing ──────────────────────────────────────────────────
-
-    def _try_parse_packet(self, ble: PowerWatchdogBLE) -> bool:
-        """Extract and dispatch one complete packet from the RX buffer.
-
-        Returns True if a packet was consumed, False if more data is needed.
-        """
-        buf = ble._rx_buffer
-
-        while len(buf) >= 4:
-            ident = struct.unpack_from(">I", buf, 0)[0]
-            if ident == PACKET_IDENTIFIER:
-                break
-            del buf[0]
-
-        if len(buf) < HEADER_SIZE:
-            return False
-
-        cmd = buf[6]
-        data_len = struct.unpack_from(">H", buf, 7)[0]
-
-        if data_len > MAX_BUFFER_SIZE:
-            logger.warning("Invalid dataLen %d, discarding", data_len)
-            del buf[:4]
-            return True
-
-        total_len = HEADER_SIZE + data_len + TAIL_SIZE
-
-        if len(buf) < total_len:
-            return False
-
-        body = bytes(buf[HEADER_SIZE : HEADER_SIZE + data_len])
-        tail = struct.unpack_from(">H", buf, HEADER_SIZE + data_len)[0]
-        raw_hex = buf[:total_len].hex()
-        del buf[:total_len]
-
-        if tail != PACKET_TAIL:
-            if not getattr(ble, "_logged_bad_tail", False):
-                ble._logged_bad_tail = True
-                hx = raw_hex[:200] + ("..." if len(raw_hex) > 200 else "")
-                logger.warning(
-                    "Bad packet tail 0x%04X (expected 0x%04X); "
-                    "cmd=%d data_len=%d frame_hex_prefix=%s",
-                    tail, PACKET_TAIL, cmd, data_len, hx,
-                )
-            else:
-                logger.debug(
-                    "Bad packet tail 0x%04X (expected 0x%04X)",
-                    tail, PACKET_TAIL,
-                )
-            return True
-
-        wd = getattr(ble, "_watchdog", None)
-        if wd is not None:
-            wd.notify_activity()
-
-        if cmd == CMD_DL_REPORT:
-            _parse_dl_report(ble, body, raw_hex)
-        elif cmd == CMD_ERROR_REPORT:
-            logger.debug("ErrorReport received (%d bytes body)", len(body))
-        elif cmd == CMD_ALARM:
-            logger.warning("Alarm notification received from Power Watchdog")
-        else:
-            logger.debug("Unknown cmd %d (%d bytes body)", cmd, len(body))
-
-        return True
-
-
 # ── DLReport parsing ────────────────────────────────────────────────────────
 
 def _parse_dl_report(ble: PowerWatchdogBLE, body: bytes, raw_hex: str) -> None:
-    """Parse a DLReport body (34 bytes = single line, 68 bytes = dual line)."""
-    has_booster = getattr(ble, "_has_booster", False)
+    """Dispatch a DLReport body to the single- or dual-line parser.
 
+    A given device emits one body length for its entire lifetime
+    (34 bytes single line, 68 dual), so the first DLReport picks the
+    matching specialized parser and caches it on the instance; from
+    then on the handler calls it directly and skips this length chain.
+    """
     if len(body) == DL_DATA_SIZE:
-        l1 = parse_dl_data(body, 0, has_booster)
-        with ble._data_lock:
-            ble._data.l1 = l1
-            ble._data.has_l2 = False
-            ble._data.timestamp = time.time()
-            ble._data.raw_hex = raw_hex
+        ble._parse_dl = _parse_dl_single
+    elif len(body) == DL_DATA_SIZE * 2:
+        ble._parse_dl = _parse_dl_dual
+    else:
+        logger.warning(
+            "Unexpected DLReport body length: %d (expected %d or %d)",
+            len(body), DL_DATA_SIZE, DL_DATA_SIZE * 2,
+        )
+        return
+    ble._parse_dl(ble, body, raw_hex)
+
+
+def _parse_dl_single(ble: PowerWatchdogBLE, body: bytes, raw_hex: str) -> None:
+    """Parse a 34-byte single-line DLReport body."""
+    if len(body) != DL_DATA_SIZE:
+        # Length changed underneath us (malformed frame) — re-dispatch.
+        ble._parse_dl = _parse_dl_report
+        _parse_dl_report(ble, body, raw_hex)
+        return
+
+    cb = ble.on_data
+
+    # Telemetry frequently repeats byte-for-byte between 1 Hz updates;
+    # a C-level compare is far cheaper than re-parsing, so just refresh
+    # the timestamp when the body is unchanged.
+    if body == ble._last_body:
+        ble._data = replace(ble._data, timestamp=_monotonic())
+        if cb is not None:
+            cb()
+        return
+    # body may be a short-lived memoryview of the RX buffer; keep an
+    # owned copy for the comparison on the next packet.
+    ble._last_body = bytes(body)
+
+    has_booster = getattr(ble, "_has_booster", False)
+    # Monotonic received-at stamp: consumers only check freshness,
+    # not wall-clock.
+    ts = _monotonic()
+
+    l1 = parse_dl_data(body, 0, has_booster)
+    # Publishing the immutable snapshot is a single GIL-atomic
+    # reference swap; no lock needed for single-writer/multi-reader.
+    ble._data = WatchdogData(l1=l1, has_l2=False, timestamp=ts, raw_hex=raw_hex)
+    if cb is not None:
+        cb()
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "L1: %.1fV %.2fA %.1fW %.3fkWh %.1fHz err=%d",
             l1.voltage, l1.current, l1.power,
             l1.energy, l1.frequency, l1.error_code,
         )
 
-    elif len(body) == DL_DATA_SIZE * 2:
-        l1 = parse_dl_data(body, 0, has_booster)
-        l2 = parse_dl_data(body, DL_DATA_SIZE, has_booster)
-        with ble._data_lock:
-            ble._data.l1 = l1
-            ble._data.l2 = l2
-            ble._data.has_l2 = True
-            ble._data.timestamp = time.time()
-            ble._data.raw_hex = raw_hex
+
+def _parse_dl_dual(ble: PowerWatchdogBLE, body: bytes, raw_hex: str) -> None:
+    """Parse a 68-byte dual-line DLReport body."""
+    if len(body) != DL_DATA_SIZE * 2:
+        ble._parse_dl = _parse_dl_report
+        _parse_dl_report(ble, body, raw_hex)
+        return
+
+    cb = ble.on_data
+    if body == ble._last_body:
+        ble._data = replace(ble._data, timestamp=_monotonic())
+        if cb is not None:
+            cb()
+        return
+    ble._last_body = bytes(body)
+
+    has_booster = getattr(ble, "_has_booster", False)
+    ts = _monotonic()
+
+    # Unpack both 34-byte blocks with one compiled-Struct call and split
+    # the flat value tuple per line.
+    vals = _DL2_STRUCT.unpack_from(body, 0)
+    l1 = _make_line(vals[:_DL_NFIELDS], has_booster)
+    l2 = _make_line(vals[_DL_NFIELDS:], has_booster)
+    ble._data = WatchdogData(
+        l1=l1, l2=l2, has_l2=True, timestamp=ts, raw_hex=raw_hex,
+    )
+    if cb is not None:
+        cb()
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "L1: %.1fV %.2fA %.1fW | L2: %.1fV %.2fA %.1fW",
             l1.voltage, l1.current, l1.power,
             l2.voltage, l2.current, l2.power,
         )
 
-    else:
-        logger.warning(
-            "Unexpected DLReport body length: %d (expected %d or %d)",
-            len(body), DL_DATA_SIZE, DL_DATA_SIZE * 2,
-        )
-
 
 def parse_dl_data(body: bytes, offset: int, has_booster: bool = False) -> LineData:
     """Parse a single 34-byte DLData block into a LineData object.
@@ -249,31 +396,35 @@ def parse_dl_data(body: bytes, offset: int, has_booster: bool = False) -> LineDa
     voltage bytes with the energy counter, so those fields are
     suppressed (set to defaults) when ``has_booster`` is False.
     """
-    o = offset
-    voltage_raw = struct.unpack_from(">i", body, o)[0]
-    current_raw = struct.unpack_from(">i", body, o + 4)[0]
-    power_raw = struct.unpack_from(">i", body, o + 8)[0]
-    energy_raw = struct.unpack_from(">i", body, o + 12)[0]
-    freq_raw = struct.unpack_from(">i", body, o + 28)[0]
-    error_code = body[o + 32]
-    status = body[o + 33]
+    return _make_line(_DL_STRUCT.unpack_from(body, offset), has_booster)
+
+
+def _make_line(vals: tuple, has_booster: bool) -> LineData:
+    """Build a LineData from one line's worth of unpacked DLData values."""
+    (
+        voltage_raw, current_raw, power_raw, energy_raw,
+        output_v_raw, _backlight, _neutral, boost_flag, _temp,
+        freq_raw, error_code, status,
+    ) = vals
 
     if has_booster:
-        output_v_raw = struct.unpack_from(">i", body, o + 20)[0]
-        output_voltage = output_v_raw / 10000.0
-        boost = body[o + 26] == 1
+        output_voltage = output_v_raw * _SCALE_1E4
+        boost = boost_flag == 1
     else:
         output_voltage = 0.0
         boost = False
 
+    # Positional construction (field order: voltage, current, power,
+    # energy, output_voltage, frequency, error_code, status, boost)
+    # skips the kwargs dict per line on the hot path.
     return LineData(
-        voltage=voltage_raw / 10000.0,
-        current=current_raw / 10000.0,
-        power=power_raw / 10000.0,
-        energy=energy_raw / 10000.0,
-        output_voltage=output_voltage,
-        frequency=freq_raw / 100.0,
-        error_code=error_code,
-        status=status,
-        boost=boost,
+        voltage_raw * _SCALE_1E4,
+        current_raw * _SCALE_1E4,
+        power_raw * _SCALE_1E4,
+        energy_raw * _SCALE_1E4,
+        output_voltage,
+        freq_raw * _SCALE_1E2,
+        error_code,
+        status,
+        boost,
     )
@@ -2,37 +2,62 @@
 
 The production code imports Venus OS libraries (dbus, gi, vedbus,
 settingsdevice) and BLE libraries (bleak) that are not available in a
-normal development/CI environment.  We mock them at the sys.modules
+normal development/CI environment.  We stub them at the sys.modules
 level before any production code is imported.
+
+The stubs are generative: a module-level ``__getattr__`` (PEP 562)
+hands out a cached no-op callable for any name the production code
+asks for.  This replaces the old per-name ``MagicMock`` forest — no
+test asserts against these modules, so MagicMock's call-recording
+bookkeeping was pure overhead on every mocked call.  The few names
+with real semantics (subclassed classes, exception types, value
+converters) stay explicit below.
 """
 
 from __future__ import annotations
 
 import sys
 import types
-from unittest.mock import MagicMock
 
 # ── BLE (bleak + bleak-connection-manager) ────────────────────────────────
 # Real packages from ext/ are used (see pytest.ini pythonpath).  Do not stub
 # ``bleak`` here — a stub shadows the package and breaks BCM imports.
 
-# ── Mock dbus and gi ────────────────────────────────────────────────────────
 
-_dbus = types.ModuleType("dbus")
-_dbus.bus = types.ModuleType("dbus.bus")
-_dbus.bus.BusConnection = MagicMock()
-_dbus.bus.BusConnection.TYPE_SYSTEM = 0
-_dbus.bus.BusConnection.TYPE_SESSION = 1
-_dbus.SystemBus = MagicMock
-_dbus.SessionBus = MagicMock
+def _make_stub_module(name: str) -> types.ModuleType:
+    """Module whose attributes resolve to cached per-name no-op callables."""
+    mod = types.ModuleType(name)
+    cache: dict = {}
+
+    def _getattr(attr: str, _cache=cache):
+        if attr not in _cache:
+            _cache[attr] = lambda *a, **kw: None
+        return _cache[attr]
+
+    mod.__getattr__ = _getattr
+    return mod
+
+
+# ── Stub dbus and gi ────────────────────────────────────────────────────────
+
+class _BusConnection:
+    """Real class (not a stub callable): production code subclasses it."""
+
+    TYPE_SYSTEM = 0
+    TYPE_SESSION = 1
+
+    def __new__(cls, *args, **kwargs):
+        return object.__new__(cls)
+
+
+_dbus = _make_stub_module("dbus")
+_dbus.bus = _make_stub_module("dbus.bus")
+_dbus.bus.BusConnection = _BusConnection
 _dbus.Int32 = int
-_dbus.Interface = MagicMock()
-_dbus.service = types.ModuleType("dbus.service")
-_dbus.service.BusName = MagicMock()
+_dbus.service = _make_stub_module("dbus.service")
 _dbus.exceptions = types.ModuleType("dbus.exceptions")
 _dbus.exceptions.DBusException = type("DBusException", (Exception,), {})
-_dbus_mainloop_glib = types.ModuleType("dbus.mainloop.glib")
-_dbus_mainloop_glib.DBusGMainLoop = MagicMock()
+_dbus_mainloop_glib = _make_stub_module("dbus.mainloop.glib")
 
 sys.modules.setdefault("dbus", _dbus)
 sys.modules.setdefault("dbus.bus", _dbus.bus)
@@ -43,14 +68,11 @@ sys.modules.setdefault("dbus.mainloop.glib", _dbus_mainloop_glib)
 
 _gi = types.ModuleType("gi")
 _gi.repository = types.ModuleType("gi.repository")
-_gi.repository.GLib = MagicMock()
+_gi.repository.GLib = _make_stub_module("gi.repository.GLib")
 sys.modules.setdefault("gi", _gi)
 sys.modules.setdefault("gi.repository", _gi.repository)
 
-# ── Mock velib_python (vedbus, settingsdevice) ──────────────────────────────
-
-sys.modules.setdefault("vedbus", types.ModuleType("vedbus"))
-sys.modules["vedbus"].VeDbusService = MagicMock()
+# ── Stub velib_python (vedbus, settingsdevice) ──────────────────────────────
 
-sys.modules.setdefault("settingsdevice", types.ModuleType("settingsdevice"))
-sys.modules["settingsdevice"].SettingsDevice = MagicMock()
+sys.modules.setdefault("vedbus", _make_stub_module("vedbus"))
+sys.modules.setdefault("settingsdevice", _make_stub_module("settingsdevice"))
@@ -223,34 +223,32 @@ class TestClassifyDevice:
 
     # ── Gen2 (WD_ prefix) ───────────────────────────────────────────────
 
-    @pytest.mark.parametrize("name,expected_type,expected_line", [
-        ("WD_E5_1a2b3c4d5e6f", "E5", "single"),
-        ("WD_E6_aabbccddeeff", "E6", "single"),
-        ("WD_V5_112233445566", "V5", "single"),
-        ("WD_V6_deadbeef1234", "V6", "single"),
-    ])
-    def test_gen2_30a_single(self, name, expected_type, expected_line):
-        result = classify_device(name)
-        assert result is not None
-        assert result.generation == 2
-        assert result.device_type == expected_type
-        assert result.line_type == expected_line
-        assert result.mac == ""  # caller fills this in
-
-    @pytest.mark.parametrize("name,expected_type,expected_line", [
-        ("WD_E7_1a2b3c4d5e6f", "E7", "double"),
-        ("WD_E8_aabbccddeeff", "E8", "double"),
-        ("WD_E9_112233445566", "E9", "double"),
-        ("WD_V7_deadbeef1234", "V7", "double"),
-        ("WD_V8_abcdef012345", "V8", "double"),
-        ("WD_V9_ffffffffffff", "V9", "double"),
-    ])
-    def test_gen2_50a_double(self, name, expected_type, expected_line):
-        result = classify_device(name)
-        assert result is not None
-        assert result.generation == 2
-        assert result.device_type == expected_type
-        assert result.line_type == expected_line
+    def test_gen2_known_models(self):
+        # Single sweep over all known model codes: one test item instead
+        # of ten parametrized ones, with the failing name in the assert
+        # message.  Boundary/negative cases keep per-case parametrize
+        # below where individual reporting matters.
+        cases = [
+            # 30A single-line
+            ("WD_E5_1a2b3c4d5e6f", "E5", "single"),
+            ("WD_E6_aabbccddeeff", "E6", "single"),
+            ("WD_V5_112233445566", "V5", "single"),
+            ("WD_V6_deadbeef1234", "V6", "single"),
+            # 50A dual-line
+            ("WD_E7_1a2b3c4d5e6f", "E7", "double"),
+            ("WD_E8_aabbccddeeff", "E8", "double"),
+            ("WD_E9_112233445566", "E9", "double"),
+            ("WD_V7_deadbeef1234", "V7", "double"),
+            ("WD_V8_abcdef012345", "V8", "double"),
+            ("WD_V9_ffffffffffff", "V9", "double"),
+        ]
+        for name, expected_type, expected_line in cases:
+            result = classify_device(name)
+            assert result is not None, name
+            assert result.generation == 2, name
+            assert result.device_type == expected_type, name
+            assert result.line_type == expected_line, name
+            assert result.mac == "", name  # caller fills this in
 
     def test_gen2_unknown_model_number(self):
         result = classify_device("WD_E3_abcdef123456")
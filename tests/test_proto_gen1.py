@@ -7,8 +7,8 @@ L1/L2 line detection without requiring a real Bluetooth adapter.
 from __future__ import annotations
 
 import struct
-import threading
-from unittest.mock import patch
+
+import pytest
 
 from power_watchdog_ble import (
     WatchdogData,
@@ -27,12 +27,14 @@ from power_watchdog_proto_gen1 import (
 
 
 def _make_ble_instance(device_name=None):
-    """Create a PowerWatchdogBLE with daemon thread suppressed and Gen1 state."""
-    with patch.object(PowerWatchdogBLE, "__init__", lambda self, **kw: None):
-        ble = PowerWatchdogBLE.__new__(PowerWatchdogBLE)
+    """Create a PowerWatchdogBLE with daemon thread suppressed and Gen1 state.
+
+    ``__new__`` already skips ``__init__`` (and with it the worker thread),
+    so no mock patching is needed.
+    """
+    ble = PowerWatchdogBLE.__new__(PowerWatchdogBLE)
 
     ble._data = WatchdogData()
-    ble._data_lock = threading.Lock()
     ble._connected = False
     ble._running = False
     ble._loop = None
@@ -43,6 +45,12 @@ def _make_ble_instance(device_name=None):
     return ble, proto
 
 
+@pytest.fixture
+def ble_proto():
+    """Default (no advertised name) BLE instance + Gen1 protocol pair."""
+    return _make_ble_instance()
+
+
 # ── Telemetry building helpers ─────────────────────────────────────────────
 
 
@@ -79,8 +87,8 @@ def _gen1_chunks(merged: bytes) -> tuple[bytearray, bytearray]:
 class TestGen1TelemetryParser:
     """Tests for parse_gen1_telemetry (the 40-byte merged buffer parser)."""
 
-    def test_typical_values(self):
-        ble, _ = _make_ble_instance()
+    def test_typical_values(self, ble_proto):
+        ble, _ = ble_proto
         merged = _build_gen1_merged(
             voltage_v=122.3, current_a=1.77, power_w=215.7,
             energy_kwh=50.0, frequency_hz=60.0, error_code=3,
@@ -95,14 +103,14 @@ class TestGen1TelemetryParser:
         assert abs(data.l1.frequency - 60.0) < 0.1
         assert data.l1.error_code == 3
 
-    def test_error_code_zero_by_default(self):
-        ble, _ = _make_ble_instance()
+    def test_error_code_zero_by_default(self, ble_proto):
+        ble, _ = ble_proto
         merged = _build_gen1_merged(voltage_v=120.0)
         parse_gen1_telemetry(ble, merged)
         assert ble.get_data().l1.error_code == 0
 
-    def test_zero_values(self):
-        ble, _ = _make_ble_instance()
+    def test_zero_values(self, ble_proto):
+        ble, _ = ble_proto
         merged = _build_gen1_merged(
             voltage_v=0, current_a=0, power_w=0,
             energy_kwh=0, frequency_hz=0,
@@ -112,8 +120,8 @@ class TestGen1TelemetryParser:
         assert data.l1.voltage == 0.0
         assert data.l1.frequency == 0.0
 
-    def test_wrong_buffer_size_ignored(self):
-        ble, _ = _make_ble_instance()
+    def test_wrong_buffer_size_ignored(self, ble_proto):
+        ble, _ = ble_proto
         parse_gen1_telemetry(ble, b"\x00" * 30)
         assert ble.get_data().timestamp == 0.0
 
@@ -124,8 +132,8 @@ class TestGen1TelemetryParser:
 class TestGen1NotificationHandler:
     """Tests for the Gen1 two-chunk state machine."""
 
-    def test_two_chunk_assembly(self):
-        ble, proto = _make_ble_instance()
+    def test_two_chunk_assembly(self, ble_proto):
+        ble, proto = ble_proto
         merged = _build_gen1_merged(voltage_v=119.5, frequency_hz=60.0)
         chunk1, chunk2 = _gen1_chunks(merged)
 
@@ -137,17 +145,17 @@ class TestGen1NotificationHandler:
         assert data.timestamp > 0
         assert abs(data.l1.voltage - 119.5) < 0.01
 
-    def test_second_chunk_without_first_ignored(self):
-        ble, proto = _make_ble_instance()
+    def test_second_chunk_without_first_ignored(self, ble_proto):
+        ble, proto = ble_proto
         merged = _build_gen1_merged(voltage_v=120.0)
         _, chunk2 = _gen1_chunks(merged)
 
         proto.notification_handler(ble, None, chunk2)
         assert ble.get_data().timestamp == 0.0
 
-    def test_duplicate_first_chunk_resets_state(self):
+    def test_duplicate_first_chunk_resets_state(self, ble_proto):
         """If two first-chunks arrive in a row, only the latest is kept."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         m1 = _build_gen1_merged(voltage_v=100.0)
         m2 = _build_gen1_merged(voltage_v=120.0)
         c1a, _ = _gen1_chunks(m1)
@@ -160,13 +168,13 @@ class TestGen1NotificationHandler:
         data = ble.get_data()
         assert abs(data.l1.voltage - 120.0) < 0.01
 
-    def test_wrong_size_chunk_ignored(self):
-        ble, proto = _make_ble_instance()
+    def test_wrong_size_chunk_ignored(self, ble_proto):
+        ble, proto = ble_proto
         proto.notification_handler(ble, None, bytearray(15))
         assert ble.get_data().timestamp == 0.0
 
-    def test_sequential_updates(self):
-        ble, proto = _make_ble_instance()
+    def test_sequential_updates(self, ble_proto):
+        ble, proto = ble_proto
 
         m1 = _build_gen1_merged(voltage_v=120.0)
         c1, c2 = _gen1_chunks(m1)
@@ -187,18 +195,18 @@ class TestGen1NotificationHandler:
 class TestGen1LineDetection:
     """Tests for L1/L2 detection using line marker bytes."""
 
-    def test_single_line_default_l1(self):
+    def test_single_line_default_l1(self, ble_proto):
         """Single-line device: markers (0,0,0) always means L1."""
-        ble, _ = _make_ble_instance()
+        ble, _ = ble_proto
         merged = _build_gen1_merged(voltage_v=120.0, line_markers=(0, 0, 0))
         parse_gen1_telemetry(ble, merged)
         data = ble.get_data()
         assert data.has_l2 is False
         assert abs(data.l1.voltage - 120.0) < 0.01
 
-    def test_v2v3_dual_line(self):
+    def test_v2v3_dual_line(self, ble_proto):
         """v2/v3 50A: markers (1,1,1) = L2, anything else = L1."""
-        ble, _ = _make_ble_instance()
+        ble, _ = ble_proto
 
         m1 = _build_gen1_merged(voltage_v=120.0, line_markers=(1, 0, 0))
         parse_gen1_telemetry(ble, m1)
@@ -211,9 +219,9 @@ class TestGen1LineDetection:
         assert abs(data.l2.voltage - 121.0) < 0.01
         assert abs(data.l1.voltage - 120.0) < 0.01
 
-    def test_v2v3_zero_markers_are_l1(self):
+    def test_v2v3_zero_markers_are_l1(self, ble_proto):
         """v2/v3 50A: (0,0,0) must remain L1 even after (1,1,1) is seen."""
-        ble, _ = _make_ble_instance()
+        ble, _ = ble_proto
 
         # L2 frame locks version inference
         m1 = _build_gen1_merged(voltage_v=121.0, line_markers=(1, 1, 1))
@@ -227,9 +235,9 @@ class TestGen1LineDetection:
         assert abs(data.l1.voltage - 120.0) < 0.01
         assert abs(data.l2.voltage - 121.0) < 0.01
 
-    def test_v1_dual_line_after_nonzero_marker(self):
+    def test_v1_dual_line_after_nonzero_marker(self, ble_proto):
         """v1 50A: (0,0,0) = L2 but only once dual-line is detected."""
-        ble, _ = _make_ble_instance()
+        ble, _ = ble_proto
 
         m1 = _build_gen1_merged(voltage_v=120.0, line_markers=(1, 0, 0))
         parse_gen1_telemetry(ble, m1)
@@ -7,8 +7,8 @@ and handshake logic without requiring a real Bluetooth adapter.
 from __future__ import annotations
 
 import struct
-import threading
-from unittest.mock import patch
+
+import pytest
 
 from power_watchdog_ble import (
     LineData,
@@ -30,16 +30,19 @@ from power_watchdog_proto_gen2 import (
 )
 
 
-# ── Test instance factory ──────────────────────────────────────────────────
+# ── Test instance fixture ──────────────────────────────────────────────────
+
 
+@pytest.fixture
+def ble_proto():
+    """A PowerWatchdogBLE with daemon thread suppressed, plus Gen2 protocol.
 
-def _make_ble_instance():
-    """Create a PowerWatchdogBLE with daemon thread suppressed and Gen2 state."""
-    with patch.object(PowerWatchdogBLE, "__init__", lambda self, **kw: None):
-        ble = PowerWatchdogBLE.__new__(PowerWatchdogBLE)
+    ``__new__`` already skips ``__init__`` (and with it the worker thread),
+    so no mock patching is needed.
+    """
+    ble = PowerWatchdogBLE.__new__(PowerWatchdogBLE)
 
     ble._data = WatchdogData()
-    ble._data_lock = threading.Lock()
     ble._connected = False
     ble._running = False
     ble._loop = None
@@ -52,6 +55,12 @@ def _make_ble_instance():
 
 # ── Packet building helpers ────────────────────────────────────────────────
 
+# Compiled once: pack_into with a literal format re-parses the format
+# string on every call, and these helpers run in every handler test.
+_DL_BUILD_STRUCT = struct.Struct(">iiiiiiBBBBiBB")   # 34-byte DLData block
+_HDR_STRUCT = struct.Struct(">IBBBH")                # 9-byte frame header
+_TAIL_BYTES = PACKET_TAIL.to_bytes(2, "big")
+
 
 def _build_dl_data(
     voltage_v: float = 120.0,
@@ -65,34 +74,28 @@ def _build_dl_data(
     boost: bool = False,
 ) -> bytes:
     """Build a 34-byte DLData block from human-readable values."""
-    buf = bytearray(DL_DATA_SIZE)
-    struct.pack_into(">i", buf, 0, int(voltage_v * 10000))
-    struct.pack_into(">i", buf, 4, int(current_a * 10000))
-    struct.pack_into(">i", buf, 8, int(power_w * 10000))
-    struct.pack_into(">i", buf, 12, int(energy_kwh * 10000))
-    struct.pack_into(">i", buf, 16, 0)  # temp1 (unused)
-    struct.pack_into(">i", buf, 20, int(output_voltage_v * 10000))
-    buf[24] = 0  # backlight
-    buf[25] = 0  # neutralDetection
-    buf[26] = 1 if boost else 0
-    buf[27] = 25  # temperature
-    struct.pack_into(">i", buf, 28, int(frequency_hz * 100))
-    buf[32] = error_code
-    buf[33] = status
-    return bytes(buf)
+    return _DL_BUILD_STRUCT.pack(
+        int(voltage_v * 10000),
+        int(current_a * 10000),
+        int(power_w * 10000),
+        int(energy_kwh * 10000),
+        0,                        # temp1 (unused)
+        int(output_voltage_v * 10000),
+        0,                        # backlight
+        0,                        # neutralDetection
+        1 if boost else 0,
+        25,                       # temperature
+        int(frequency_hz * 100),
+        error_code,
+        status,
+    )
 
 
 def _build_packet(cmd: int, body: bytes) -> bytes:
     """Build a complete framed packet with header + body + tail."""
-    header = bytearray(HEADER_SIZE)
-    struct.pack_into(">I", header, 0, PACKET_IDENTIFIER)
-    header[4] = 1   # version
-    header[5] = 0   # msgId
-    header[6] = cmd
-    struct.pack_into(">H", header, 7, len(body))
-
-    tail = struct.pack(">H", PACKET_TAIL)
-    return bytes(header) + body + tail
+    # Header fields: identifier, version=1, msgId=0, cmd, dataLen
+    return _HDR_STRUCT.pack(PACKET_IDENTIFIER, 1, 0, cmd, len(body)) \
+        + body + _TAIL_BYTES
 
 
 # ── parse_dl_data ──────────────────────────────────────────────────────────
@@ -138,6 +141,15 @@ class TestParseDlData:
         assert abs(result.power - 12000.0) < 0.01
         assert abs(result.frequency - 50.0) < 0.1
 
+    def test_memoryview_input(self):
+        # The notification handler hands parse_dl_data zero-copy
+        # memoryviews of the RX buffer; make sure that path stays valid
+        # for direct callers too.
+        body = _build_dl_data(voltage_v=122.3, current_a=1.77)
+        result = parse_dl_data(memoryview(body), 0)
+        assert abs(result.voltage - 122.3) < 0.01
+        assert abs(result.current - 1.77) < 0.01
+
     def test_boost_flag_suppressed_for_non_booster(self):
         # Non-booster models (E5/V5, E6/V6, E7/V7) repurpose byte 26 as
         # part of the energy counter, so the boost field must be False
@@ -177,13 +189,13 @@ class TestParseDlData:
 class TestNotificationHandler:
     """Tests for the Gen2 notification handler and packet parser."""
 
-    def test_single_line_packet(self):
-        ble, proto = _make_ble_instance()
+    def test_single_line_packet(self, ble_proto):
+        ble, proto = ble_proto
         body = _build_dl_data(voltage_v=122.0, current_a=1.5, power_w=183.0,
                               energy_kwh=100.0, frequency_hz=60.0)
         packet = _build_packet(CMD_DL_REPORT, body)
 
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
 
         data = ble.get_data()
         assert data.timestamp > 0
@@ -192,8 +204,8 @@ class TestNotificationHandler:
         assert abs(data.l1.current - 1.5) < 0.01
         assert abs(data.l1.power - 183.0) < 0.01
 
-    def test_dual_line_packet(self):
-        ble, proto = _make_ble_instance()
+    def test_dual_line_packet(self, ble_proto):
+        ble, proto = ble_proto
         l1 = _build_dl_data(voltage_v=122.0, current_a=1.77, power_w=178.0,
                             frequency_hz=60.0)
         l2 = _build_dl_data(voltage_v=123.5, current_a=0.36, power_w=7.0,
@@ -201,7 +213,7 @@ class TestNotificationHandler:
         body = l1 + l2
         packet = _build_packet(CMD_DL_REPORT, body)
 
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
 
         data = ble.get_data()
         assert data.has_l2 is True
@@ -209,49 +221,49 @@ class TestNotificationHandler:
         assert abs(data.l2.voltage - 123.5) < 0.01
         assert abs(data.l2.current - 0.36) < 0.01
 
-    def test_fragmented_delivery(self):
+    def test_fragmented_delivery(self, ble_proto):
         """Packet arrives in two separate BLE notifications."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         body = _build_dl_data(voltage_v=120.0, frequency_hz=60.0)
         packet = _build_packet(CMD_DL_REPORT, body)
 
         mid = len(packet) // 2
-        proto.notification_handler(ble, None, bytearray(packet[:mid]))
+        proto.notification_handler(ble, None, packet[:mid])
         assert ble.get_data().timestamp == 0.0
 
-        proto.notification_handler(ble, None, bytearray(packet[mid:]))
+        proto.notification_handler(ble, None, packet[mid:])
         assert ble.get_data().timestamp > 0
         assert abs(ble.get_data().l1.voltage - 120.0) < 0.01
 
-    def test_multiple_packets_in_one_notification(self):
+    def test_multiple_packets_in_one_notification(self, ble_proto):
         """Two complete packets arrive in a single BLE notification."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
 
         body1 = _build_dl_data(voltage_v=120.0)
         body2 = _build_dl_data(voltage_v=121.0)
         combined = _build_packet(CMD_DL_REPORT, body1) + _build_packet(CMD_DL_REPORT, body2)
 
-        proto.notification_handler(ble, None, bytearray(combined))
+        proto.notification_handler(ble, None, combined)
 
         data = ble.get_data()
         assert abs(data.l1.voltage - 121.0) < 0.01
 
-    def test_garbage_before_packet(self):
+    def test_garbage_before_packet(self, ble_proto):
         """Random bytes precede the actual packet."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         body = _build_dl_data(voltage_v=119.0)
         packet = _build_packet(CMD_DL_REPORT, body)
 
-        garbage = bytearray(b"\xDE\xAD\xBE\xEF\x00\x01\x02")
-        proto.notification_handler(ble, None, garbage + bytearray(packet))
+        garbage = b"\xDE\xAD\xBE\xEF\x00\x01\x02"
+        proto.notification_handler(ble, None, garbage + packet)
 
         data = ble.get_data()
         assert data.timestamp > 0
         assert abs(data.l1.voltage - 119.0) < 0.01
 
-    def test_bad_tail(self):
+    def test_bad_tail(self, ble_proto):
         """Packet with corrupted tail marker is consumed but data is not updated."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         body = _build_dl_data(voltage_v=120.0)
         packet = bytearray(_build_packet(CMD_DL_REPORT, body))
         packet[-2] = 0xFF
@@ -260,38 +272,46 @@ class TestNotificationHandler:
         proto.notification_handler(ble, None, packet)
         assert ble.get_data().timestamp == 0.0
 
-    def test_buffer_overflow_protection(self):
-        """Buffer is cleared when it exceeds MAX_BUFFER_SIZE."""
-        ble, proto = _make_ble_instance()
-        ble._rx_buffer = bytearray(MAX_BUFFER_SIZE - 10)
+    def test_buffer_overflow_protection(self, ble_proto):
+        """A pending frame that can never fit the buffer is dropped."""
+        ble, proto = ble_proto
+        # Valid header whose claimed body can never complete within
+        # MAX_BUFFER_SIZE (total frame = MAX + 6 bytes).
+        header = bytearray(HEADER_SIZE)
+        struct.pack_into(">I", header, 0, PACKET_IDENTIFIER)
+        header[6] = CMD_DL_REPORT
+        struct.pack_into(">H", header, 7, MAX_BUFFER_SIZE - 5)
 
-        proto.notification_handler(ble, None, bytearray(20))
-        assert len(ble._rx_buffer) == 0
+        proto.notification_handler(ble, None, header)
+        proto.notification_handler(ble, None, bytearray(4096))
+        proto.notification_handler(ble, None, bytearray(4096))
+        assert ble._rx_len == 0
+        assert ble.get_data().timestamp == 0.0
 
-    def test_error_report_does_not_crash(self):
-        ble, proto = _make_ble_instance()
+    def test_error_report_does_not_crash(self, ble_proto):
+        ble, proto = ble_proto
         body = b"\x00" * 10
         packet = _build_packet(CMD_ERROR_REPORT, body)
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
         assert ble.get_data().timestamp == 0.0
 
-    def test_alarm_does_not_crash(self):
-        ble, proto = _make_ble_instance()
+    def test_alarm_does_not_crash(self, ble_proto):
+        ble, proto = ble_proto
         body = b"\x01\x02"
         packet = _build_packet(CMD_ALARM, body)
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
         assert ble.get_data().timestamp == 0.0
 
-    def test_unknown_command(self):
-        ble, proto = _make_ble_instance()
+    def test_unknown_command(self, ble_proto):
+        ble, proto = ble_proto
         body = b"\x00" * 4
         packet = _build_packet(99, body)
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
         assert ble.get_data().timestamp == 0.0
 
-    def test_invalid_data_len(self):
+    def test_invalid_data_len(self, ble_proto):
         """Packet claiming a body length > MAX_BUFFER_SIZE is discarded."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         header = bytearray(HEADER_SIZE)
         struct.pack_into(">I", header, 0, PACKET_IDENTIFIER)
         header[4] = 1
@@ -302,26 +322,26 @@ class TestNotificationHandler:
         proto.notification_handler(ble, None, header)
         assert ble.get_data().timestamp == 0.0
 
-    def test_unexpected_dl_report_length(self):
+    def test_unexpected_dl_report_length(self, ble_proto):
         """DLReport with body length != 34 and != 68 is logged but not parsed."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         body = b"\x00" * 20
         packet = _build_packet(CMD_DL_REPORT, body)
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
         assert ble.get_data().timestamp == 0.0
 
-    def test_get_data_thread_safety(self):
+    def test_get_data_thread_safety(self, ble_proto):
         """get_data returns a snapshot, not a reference to internal state."""
-        ble, proto = _make_ble_instance()
+        ble, proto = ble_proto
         body = _build_dl_data(voltage_v=120.0)
         packet = _build_packet(CMD_DL_REPORT, body)
 
-        proto.notification_handler(ble, None, bytearray(packet))
+        proto.notification_handler(ble, None, packet)
         snap1 = ble.get_data()
 
         body2 = _build_dl_data(voltage_v=130.0)
         packet2 = _build_packet(CMD_DL_REPORT, body2)
-        proto.notification_handler(ble, None, bytearray(packet2))
+        proto.notification_handler(ble, None, packet2)
         snap2 = ble.get_data()
 
         assert abs(snap1.l1.voltage - 120.0) < 0.01
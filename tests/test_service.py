@@ -8,10 +8,10 @@ mocked; we focus on the pure-logic helpers.
 
 from __future__ import annotations
 
-import configparser
 import importlib
 import importlib.util
 import os
+import re
 import sys
 import tempfile
 from pathlib import Path
@@ -157,7 +157,7 @@ class TestSliderMath:
 
 class TestLoadConfig:
     def test_no_config_returns_empty(self, tmp_path, monkeypatch):
-        """When no config file exists, returns an empty ConfigParser."""
+        """When no config file exists, returns an empty dict."""
         monkeypatch.setattr(
             "os.path.dirname",
             lambda _: str(tmp_path),
@@ -168,7 +168,7 @@ class TestLoadConfig:
             # Call the module-level function; it reads relative to __file__
             # We need to also patch os.path.abspath
             config = pw.load_config()
-        assert isinstance(config, configparser.ConfigParser)
+        assert config == {}
 
     def test_config_ini_is_read(self, tmp_path):
         """When config.ini exists, it is loaded."""
@@ -261,8 +261,7 @@ class TestConstants:
         assert pw.ROLE_TO_SERVICE["pvinverter"] == "com.victronenergy.pvinverter"
         assert pw.ROLE_TO_SERVICE["genset"] == "com.victronenergy.genset"
 
+    _VER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
     def test_version_format(self):
-        parts = pw.VERSION.split(".")
-        assert len(parts) == 3
-        for p in parts:
-            assert p.isdigit()
+        assert self._VER_RE.match(pw.VERSION), pw.VERSION